@@ -0,0 +1,90 @@
+# Imports
+from pathlib import Path
+import sqlite3, threading, time
+
+# Internal imports
+from .utils import get_file_hash
+
+# Shorthand vars
+schema = '''
+CREATE TABLE IF NOT EXISTS archives (
+  key TEXT PRIMARY KEY,
+  hash TEXT NOT NULL,
+  size INTEGER NOT NULL,
+  last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS archives_hash ON archives (hash);
+'''
+
+# A persistent, content-addressed cache of downloaded archives.
+#
+# Archives are stored in 'objects' under the sha256 of their contents, so
+# that keys which lead to the same archive share one file. Every key records
+# when it was last used, and once the total size of the stored archives
+# exceeds `max_size`, the least recently used ones are removed.
+class ArchiveCache:
+  def __init__(self, directory, max_size: int):
+    directory = Path(directory)
+    self.objects_dir = directory / 'objects'
+    self.objects_dir.mkdir(parents=True, exist_ok=True)
+    self.max_size = max_size
+    self.lock = threading.Lock()
+    self.connection = sqlite3.connect(
+      directory / 'index.sqlite', check_same_thread=False,
+    )
+    with self.lock, self.connection:
+      self.connection.executescript(schema)
+
+  # Returns the stored archive of a given key, or None if it is not stored.
+  def get(self, key: str) -> Path or None:
+    with self.lock, self.connection:
+      row = self.connection.execute(
+        'SELECT hash, size FROM archives WHERE key = ?', (key,),
+      ).fetchone()
+      if row is None:
+        return None
+      file_hash, size = row
+      file = self.objects_dir / file_hash
+      if not file.is_file() or file.stat().st_size != size:
+        self.connection.execute(
+          'DELETE FROM archives WHERE hash = ?', (file_hash,),
+        )
+        file.unlink(missing_ok=True)
+        return None
+      self.connection.execute(
+        'UPDATE archives SET last_used = ? WHERE key = ?', (time.time(), key),
+      )
+    return file
+
+  # Moves a given archive file into the cache under a given key and returns
+  # the stored file. The file should be on the same filesystem as the cache.
+  def add(self, key: str, file: Path) -> Path:
+    file_hash = get_file_hash(file)
+    stored_file = self.objects_dir / file_hash
+    size = Path(file).stat().st_size
+    with self.lock, self.connection:
+      Path(file).replace(stored_file)
+      self.connection.execute(
+        'INSERT OR REPLACE INTO archives VALUES (?, ?, ?, ?)',
+        (key, file_hash, size, time.time()),
+      )
+      self.evict(keep=file_hash)
+    return stored_file
+
+  # Removes the least recently used archives until the total size fits
+  # within max_size, never removing the archive with hash `keep`.
+  def evict(self, keep: str = None):
+    rows = self.connection.execute(
+      'SELECT hash, size FROM archives GROUP BY hash ORDER BY MAX(last_used)',
+    ).fetchall()
+    total_size = sum([size for _, size in rows])
+    for file_hash, size in rows:
+      if total_size <= self.max_size:
+        break
+      if file_hash == keep:
+        continue
+      self.connection.execute(
+        'DELETE FROM archives WHERE hash = ?', (file_hash,),
+      )
+      (self.objects_dir / file_hash).unlink(missing_ok=True)
+      total_size -= size
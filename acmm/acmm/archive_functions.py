@@ -0,0 +1,307 @@
+# Imports
+from pathlib import Path
+from types import SimpleNamespace
+import time, os
+
+# Vars
+chunk_size = 1024 * 1024
+# Members which are never extracted along with an asset
+junk_dir_names = ['__MACOSX']
+junk_file_names = ['.ds_store', 'thumbs.db', 'desktop.ini']
+junk_file_suffixes = ['.psd']
+
+# Returns True if a given member name is junk which no asset needs.
+def is_junk(name: str) -> bool:
+  parts = name.split('/')
+  for part in parts[:-1]:
+    if part in junk_dir_names:
+      return True
+  basename = parts[-1].lower()
+  if basename in junk_file_names:
+    return True
+  for suffix in junk_file_suffixes:
+    if basename.endswith(suffix):
+      return True
+  return parts[-1] in junk_dir_names
+
+# Returns the given member name as a relative posix path, or None if it
+# would lead outside of the archive.
+def normalise_name(name: str) -> str or None:
+  parts = []
+  for part in name.replace('\\', '/').split('/'):
+    if part in ['', '.']:
+      continue
+    if part == '..':
+      return None
+    parts.append(part)
+  if not parts:
+    return None
+  return '/'.join(parts)
+
+# An archive which can be listed and partially extracted without extracting
+# all of it first. Supports zip, tar, rar and 7z archives, other types raise
+# a ValueError. Members are keyed by their normalised names, and directories
+# which are only implied by the names of their contents are added as well.
+class Archive:
+  def __init__(self, file: Path):
+    self.file = Path(file)
+    self.members = {}
+    self.dirs = {'': {}}
+    # importing on-demand for faster overall import times
+    import zipfile, tarfile
+    if zipfile.is_zipfile(self.file):
+      self.kind = 'zip'
+      self.handle = zipfile.ZipFile(self.file)
+      listing = [
+        (info.filename, info.is_dir(), info.file_size, info)
+        for info in self.handle.infolist()
+      ]
+    elif tarfile.is_tarfile(self.file):
+      self.kind = 'tar'
+      self.handle = tarfile.open(self.file)
+      listing = [
+        (info.name, info.isdir(), info.size, info)
+        for info in self.handle.getmembers()
+        if info.isdir() or info.isfile()
+      ]
+    else:
+      # importing on-demand for faster overall import times
+      import rarfile, py7zr
+      if rarfile.is_rarfile(self.file):
+        self.kind = 'rar'
+        self.handle = rarfile.RarFile(self.file)
+        listing = [
+          (info.filename, info.is_dir(), info.file_size, info)
+          for info in self.handle.infolist()
+        ]
+      elif py7zr.is_7zfile(self.file):
+        self.kind = '7z'
+        self.handle = py7zr.SevenZipFile(self.file)
+        listing = [
+          (info.filename, info.is_directory, info.uncompressed, info.filename)
+          for info in self.handle.list()
+        ]
+      else:
+        raise ValueError(f"Unsupported archive type of '{self.file}'")
+    for name, is_dir, size, info in listing:
+      name = normalise_name(name)
+      if name is None:
+        continue
+      self.add(name, is_dir, size, info)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.close()
+
+  def close(self):
+    self.handle.close()
+
+  # Adds a given member, along with any missing parent directories.
+  def add(self, name: str, is_dir: bool, size: int, info):
+    parent, _, basename = name.rpartition('/')
+    if parent not in self.dirs:
+      self.add(parent, True, 0, None)
+    self.dirs.get(parent)[basename] = is_dir
+    if is_dir:
+      self.dirs.setdefault(name, {})
+    if is_dir and name in self.members:
+      return
+    self.members[name] = SimpleNamespace(is_dir=is_dir, size=size, info=info)
+
+  # Returns the root of the archive as a VirtualPath.
+  def get_root(self) -> 'VirtualPath':
+    return VirtualPath(self, '')
+
+  # Returns the contents of a given file member.
+  def read_bytes(self, name: str) -> bytes:
+    member = self.members.get(name)
+    if member is None or member.is_dir:
+      raise FileNotFoundError(f"No file '{name}' in '{self.file}'")
+    if self.kind == '7z':
+      # importing on-demand for faster overall import times
+      import tempfile
+      with tempfile.TemporaryDirectory(prefix='acmm-') as temp_dir:
+        self.handle.reset()
+        self.handle.extract(temp_dir, targets=[member.info])
+        return (Path(temp_dir) / member.info).read_bytes()
+    if self.kind == 'tar':
+      with self.handle.extractfile(member.info) as f:
+        return f.read()
+    with self.handle.open(member.info) as f:
+      return f.read()
+
+  # Returns the modification time stored for a given member, or None.
+  def get_mtime(self, name: str) -> float or None:
+    info = self.members.get(name).info
+    try:
+      if self.kind == 'tar':
+        return info.mtime
+      if self.kind in ['zip', 'rar']:
+        return time.mktime(tuple(info.date_time) + (0, 0, -1))
+    except (AttributeError, TypeError, ValueError, OverflowError):
+      pass
+    return None
+
+  # Returns the names of all members inside the given directories, except for
+  # junk. The names are in archive order, so that compressed streams are only
+  # ever read forwards.
+  def get_tree_names(self, dir_names: list[str]) -> list[str]:
+    if '' in dir_names:
+      names = list(self.members)
+    else:
+      prefixes = tuple([name + '/' for name in dir_names])
+      names = [
+        name for name in self.members
+        if name in dir_names or name.startswith(prefixes)
+      ]
+    return [name for name in names if not is_junk(name)]
+
+  # Extracts given members to destination, or all of them if no names are
+  # given. Files keep the modification times stored in the archive, so that
+  # unchanged files can be told apart when updating installed assets.
+  # progress_function is called with the number of extracted and total bytes.
+  def extract(
+    self,
+    destination: Path,
+    names: list[str] = None,
+    progress_function: callable = None,
+  ):
+    destination = Path(destination)
+    if names is None:
+      names = list(self.members)
+    total = sum([self.members.get(name).size for name in names])
+    done = 0
+    if self.kind == '7z':
+      for name in names:
+        if self.members.get(name).is_dir:
+          (destination / name).mkdir(parents=True, exist_ok=True)
+      files = [
+        self.members.get(name).info for name in names
+        if not self.members.get(name).is_dir
+      ]
+      self.handle.reset()
+      self.handle.extract(destination, targets=files)
+      if progress_function:
+        progress_function(total, total)
+      return
+    for name in names:
+      member = self.members.get(name)
+      target = destination / name
+      if member.is_dir:
+        target.mkdir(parents=True, exist_ok=True)
+        continue
+      target.parent.mkdir(parents=True, exist_ok=True)
+      if self.kind == 'tar':
+        source = self.handle.extractfile(member.info)
+      else:
+        source = self.handle.open(member.info)
+      with source, open(target, 'wb') as f:
+        while chunk := source.read(chunk_size):
+          f.write(chunk)
+          done += len(chunk)
+          if progress_function:
+            progress_function(done, total)
+      mtime = self.get_mtime(name)
+      if mtime is not None:
+        os.utime(target, (mtime, mtime))
+
+# A path inside an Archive, which can stand in for a Path when validating
+# and detecting assets, so that archives do not have to be extracted first.
+# It also stands in for the DirEntry objects yielded by utils.walk.
+class VirtualPath:
+  def __init__(self, archive: Archive, name: str):
+    self.archive = archive
+    # The normalised name of the member, '' for the root of the archive
+    self.member_name = name
+
+  def __repr__(self) -> str:
+    return f"VirtualPath('{self}')"
+
+  def __str__(self) -> str:
+    return str(self.archive.file / self.member_name)
+
+  def __eq__(self, other) -> bool:
+    if not isinstance(other, VirtualPath):
+      return NotImplemented
+    return (self.archive, self.member_name) == (other.archive, other.member_name)
+
+  def __hash__(self) -> int:
+    return hash((id(self.archive), self.member_name))
+
+  def __truediv__(self, name: str) -> 'VirtualPath':
+    if not self.member_name:
+      return VirtualPath(self.archive, name)
+    return VirtualPath(self.archive, self.member_name + '/' + name)
+
+  @property
+  def path(self) -> str:
+    return str(self)
+
+  @property
+  def name(self) -> str:
+    if not self.member_name:
+      return self.archive.file.stem
+    return self.member_name.rpartition('/')[2]
+
+  @property
+  def parent(self) -> 'VirtualPath':
+    return VirtualPath(self.archive, self.member_name.rpartition('/')[0])
+
+  def exists(self) -> bool:
+    return self.member_name in self.archive.dirs or self.is_file()
+
+  def is_dir(self, follow_symlinks: bool = True) -> bool:
+    return self.member_name in self.archive.dirs
+
+  def is_file(self, follow_symlinks: bool = True) -> bool:
+    member = self.archive.members.get(self.member_name)
+    return member is not None and not member.is_dir
+
+  def is_symlink(self) -> bool:
+    return False
+
+  def iterdir(self) -> iter['VirtualPath']:
+    for name in self.archive.dirs.get(self.member_name, {}):
+      yield self / name
+
+  # Same as iterdir, for code written against os.scandir.
+  def scandir(self) -> iter['VirtualPath']:
+    return self.iterdir()
+
+  def stat(self, follow_symlinks: bool = True) -> SimpleNamespace:
+    member = self.archive.members.get(self.member_name)
+    if member is None:
+      if self.is_dir():
+        return SimpleNamespace(st_size=0)
+      raise FileNotFoundError(f"No member '{self.member_name}' in '{self.archive.file}'")
+    return SimpleNamespace(st_size=member.size)
+
+  def read_bytes(self) -> bytes:
+    return self.archive.read_bytes(self.member_name)
+
+  def read_text(self, encoding: str = 'utf-8', errors: str = 'strict') -> str:
+    return self.read_bytes().decode(encoding, errors)
+
+# Returns the entries of a given directory, which may be a VirtualPath.
+def scandir(path) -> iter:
+  if isinstance(path, VirtualPath):
+    return path.scandir()
+  return os.scandir(path)
+
+# Extracts a given archive file to destination. Zip, tar, rar and 7z archives
+# are read member by member straight from the file, so that memory use does
+# not grow with the size of the archive. Other types are handed to libjam,
+# which reads the whole archive into memory. progress_function is called with
+# the number of extracted and total bytes.
+def extract(file: Path, destination: Path, progress_function: callable = None):
+  try:
+    archive = Archive(file)
+  except ValueError:
+    # importing on-demand for faster overall import times
+    from libjam import drawer
+    drawer.extract_archive(str(file), str(destination), progress_function)
+    return
+  with archive:
+    archive.extract(destination, progress_function=progress_function)
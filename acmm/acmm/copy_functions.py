@@ -0,0 +1,231 @@
+# Imports
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import os, shutil, errno, threading
+
+# Internal imports
+from . import utils
+from .shared import *
+
+# Vars
+chunk_size = 1024 * 1024
+# The Linux ioctl which makes a file share the extents of another file
+FICLONE = 0x40049409
+# Errors which mean that a way of copying is not supported for the given
+# files, as opposed to the copy itself failing
+unsupported_errors = {
+  errno.EXDEV,
+  errno.EINVAL,
+  errno.ENOSYS,
+  errno.ENOTTY,
+  errno.EOPNOTSUPP,
+  errno.ENOTSUP,
+  errno.EBADF,
+  errno.EPERM,
+}
+
+# Makes destination a reflink of source, sharing its data until either is
+# modified. Returns False if the filesystem does not support it.
+def reflink(source_fd: int, destination_fd: int) -> bool:
+  try:
+    # importing on-demand, since fcntl is not available on Windows
+    import fcntl
+    fcntl.ioctl(destination_fd, FICLONE, source_fd)
+  except ImportError:
+    return False
+  except OSError as error:
+    if error.errno in unsupported_errors:
+      return False
+    raise
+  return True
+
+# Copies the contents of source to destination inside the kernel. Returns
+# False if that is not supported for the given files. If the kernel stops
+# copying early, the rest is read and written.
+def copy_range(source_fd: int, destination_fd: int, size: int) -> bool:
+  if not hasattr(os, 'copy_file_range'):
+    return False
+  copied = 0
+  while copied < size:
+    try:
+      n_bytes = os.copy_file_range(source_fd, destination_fd, size - copied)
+    except OSError as error:
+      if copied == 0 and error.errno in unsupported_errors:
+        return False
+      raise
+    if n_bytes == 0:
+      if copied == 0:
+        return False
+      while chunk := os.read(source_fd, chunk_size):
+        chunk = memoryview(chunk)
+        while chunk:
+          chunk = chunk[os.write(destination_fd, chunk):]
+      break
+    copied += n_bytes
+  return True
+
+# Replaces destination with a hardlink to source. Returns False if source
+# and destination can not be linked.
+def link_file(source: Path, destination: Path) -> bool:
+  temp_file = Path(destination).with_name(f'.{Path(destination).name}.acmm-link')
+  try:
+    os.link(source, temp_file)
+  except OSError:
+    return False
+  os.replace(temp_file, destination)
+  return True
+
+# Copies a file like shutil.copy2, but does as little I/O as the filesystem
+# allows. Tries a reflink first, then an in-kernel copy_file_range, and only
+# then falls back to reading and writing the data. With hardlink, the file is
+# linked instead of copied if possible, so that both paths share one file.
+def copy_file(source: Path, destination: Path, hardlink: bool = False) -> Path:
+  if os.path.isdir(destination):
+    destination = os.path.join(destination, os.path.basename(source))
+  if hardlink and link_file(source, destination):
+    return destination
+  # Replacing instead of writing through an existing file, which may be
+  # a hardlink or symlink to a file elsewhere
+  if os.path.lexists(destination):
+    os.unlink(destination)
+  with open(source, 'rb') as source_file:
+    with open(destination, 'wb') as destination_file:
+      source_fd = source_file.fileno()
+      destination_fd = destination_file.fileno()
+      size = os.fstat(source_fd).st_size
+      copied = (
+        reflink(source_fd, destination_fd) or
+        copy_range(source_fd, destination_fd, size)
+      )
+      if not copied:
+        shutil.copyfileobj(source_file, destination_file)
+  shutil.copystat(source, destination)
+  return destination
+
+# Returns a function which copies a source file to a destination like
+# copy_file, hardlinking if asked to.
+def get_copy_function(hardlink: bool = False) -> callable:
+  if not hardlink:
+    return copy_file
+  def copy_function(source: Path, destination: Path) -> Path:
+    return copy_file(source, destination, hardlink=True)
+  return copy_function
+
+# Returns True if the file at destination has the same contents as source,
+# judging by their sizes and mtimes. With compare_hash, files of the same
+# size whose mtimes differ are compared by their hashes.
+def is_same_file(
+  source: Path, source_stat: os.stat_result, destination: Path,
+  compare_hash: bool = False,
+) -> bool:
+  try:
+    destination_stat = os.stat(destination)
+  except FileNotFoundError:
+    return False
+  if source_stat.st_size != destination_stat.st_size:
+    return False
+  if source_stat.st_mtime_ns == destination_stat.st_mtime_ns:
+    return True
+  if not compare_hash:
+    return False
+  return utils.get_file_hash(source) == utils.get_file_hash(destination)
+
+# Transfers files given as (source, destination, size, change) tuples with
+# transfer_function, in a pool of up to `jobs` threads. The largest files are
+# started first, so that a big file does not hold up the end of the install.
+# change_function is called with the destination and change of every
+# transferred file, and progress_function with the number of transferred and
+# total bytes. Both are called from one thread at a time.
+def transfer_files(
+  transfers: list[tuple],
+  transfer_function: callable = copy_file,
+  change_function: callable = None,
+  jobs: int = None,
+  progress_function: callable = None,
+):
+  transfers = sorted(transfers, key=lambda transfer: transfer[2], reverse=True)
+  total = sum([size for _, _, size, _ in transfers])
+  done = 0
+  lock = threading.Lock()
+  def transfer_file(transfer: tuple):
+    nonlocal done
+    source, destination, size, change = transfer
+    transfer_function(source, destination)
+    with lock:
+      done += size
+      if change_function:
+        change_function(Path(destination), change)
+      if progress_function:
+        progress_function(done, total)
+  if jobs == 1 or len(transfers) < 2:
+    for transfer in transfers:
+      transfer_file(transfer)
+    return
+  with ThreadPoolExecutor(jobs) as executor:
+    for _ in executor.map(transfer_file, transfers):
+      pass
+
+# Removes whatever is at a given path if it is not of the given kind, so
+# that a directory can take the place of a file or the other way around.
+def clear_path(path: Path, is_dir: bool):
+  if is_dir:
+    if os.path.lexists(path) and not os.path.isdir(path):
+      os.unlink(path)
+  elif os.path.isdir(path):
+    utils.unlink_dir(path)
+
+# Makes a given file or directory at destination match source, transferring
+# only the files which differ with transfer_function, which takes a source
+# and destination file like shutil.copy2 or os.replace. Files which only
+# exist in destination are kept. A directory which does not exist at the
+# destination yet is renamed as a whole when transfer_function is os.replace.
+# Files are transferred by transfer_files, the remaining arguments are
+# passed on to it.
+def update_path(
+  source: Path,
+  destination: Path,
+  transfer_function: callable = copy_file,
+  compare_hash: bool = False,
+  change_function: callable = None,
+  jobs: int = None,
+  progress_function: callable = None,
+):
+  source = Path(source)
+  destination = Path(destination)
+  transfers = []
+  clear_path(destination, source.is_dir())
+  if not source.is_dir():
+    # Transferring single files
+    if is_same_file(source, source.stat(), destination, compare_hash):
+      return
+    change = FileChange.MODIFIED if destination.exists() else FileChange.ADDED
+    transfers.append((source, destination, source.stat().st_size, change))
+  elif not destination.exists() and transfer_function is os.replace:
+    # Renaming new directories as a whole
+    os.replace(source, destination)
+    if change_function:
+      for entry in utils.walk(destination):
+        if not entry.is_dir():
+          change_function(Path(entry.path), FileChange.ADDED)
+    return
+  else:
+    # Transferring the new and changed files of directories
+    is_new = not destination.exists()
+    destination.mkdir(exist_ok=True)
+    for entry in utils.walk(source):
+      target = destination / os.path.relpath(entry.path, source)
+      clear_path(target, entry.is_dir())
+      if entry.is_dir():
+        target.mkdir(exist_ok=True)
+        continue
+      stat = entry.stat()
+      if is_new or not target.exists():
+        change = FileChange.ADDED
+      elif is_same_file(entry.path, stat, target, compare_hash):
+        continue
+      else:
+        change = FileChange.MODIFIED
+      transfers.append((entry.path, target, stat.st_size, change))
+  transfer_files(
+    transfers, transfer_function, change_function, jobs, progress_function,
+  )
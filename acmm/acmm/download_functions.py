@@ -0,0 +1,167 @@
+# Imports
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import threading, json, os
+
+# Vars
+chunk_size = 64 * 1024
+# The smallest byte range fetched by a segmented download. Files smaller than
+# two segments are downloaded over a single connection.
+min_segment_size = 4 * 1024 * 1024
+
+# Returns the '.part' file a download to given file is written to.
+def get_part_file(file: Path) -> Path:
+  return file.with_name(file.name + '.part')
+
+# Returns the file in which a segmented download to given file keeps track of
+# its finished segments.
+def get_segments_file(file: Path) -> Path:
+  return file.with_name(file.name + '.segments')
+
+# Downloads given link to a file, writing it in chunks so that the download
+# never has to fit in memory. The data is written to a '.part' file first,
+# which is renamed once the download is complete. If a '.part' file is
+# already there, the download is resumed with a Range request.
+# progress_function is called with the downloaded and total number of bytes,
+# where the total is 0 if the server did not report it.
+def download(
+  link: str,
+  file: Path,
+  progress_function: callable = None,
+  session = None,
+) -> Path:
+  # importing on-demand for faster overall import times
+  import requests
+  if session is None:
+    session = requests
+  file = Path(file)
+  part_file = get_part_file(file)
+  segments_file = get_segments_file(file)
+  if segments_file.is_file():
+    # The '.part' file was left by a segmented download and has gaps in it
+    part_file.unlink(missing_ok=True)
+    segments_file.unlink()
+  downloaded = part_file.stat().st_size if part_file.is_file() else 0
+  headers = {}
+  if downloaded:
+    headers['Range'] = f'bytes={downloaded}-'
+  with session.get(link, headers=headers, stream=True) as response:
+    code = response.status_code
+    if code == 416:
+      # The partial download does not match the file anymore
+      part_file.unlink()
+      return download(link, file, progress_function, session)
+    if code == 200:
+      downloaded = 0
+      mode = 'wb'
+    elif code == 206:
+      mode = 'ab'
+    else:
+      raise ConnectionError(f"Error downloading '{link}'. Status code: {code}")
+    total = int(response.headers.get('content-length', 0))
+    if total:
+      total += downloaded
+    with open(part_file, mode) as f:
+      for chunk in response.iter_content(chunk_size):
+        f.write(chunk)
+        downloaded += len(chunk)
+        if progress_function:
+          progress_function(downloaded, total)
+  part_file.replace(file)
+  return file
+
+# Returns the size of the file behind a given link if the server supports
+# range requests for it, None otherwise.
+def get_ranged_size(link: str, session) -> int or None:
+  response = session.head(link, allow_redirects=True)
+  if response.status_code != 200:
+    return None
+  if response.headers.get('accept-ranges') != 'bytes':
+    return None
+  return int(response.headers.get('content-length', 0)) or None
+
+# Downloads given link to a file like `download`, but splits the file into
+# byte ranges which are fetched over up to `jobs` connections at once and
+# written straight into their place in a preallocated '.part' file. Finished
+# ranges are recorded next to it, so that an interrupted download only
+# fetches the missing ones again. Falls back to `download` if the server does
+# not advertise range support or the file is too small to be worth splitting.
+def download_segmented(
+  link: str,
+  file: Path,
+  progress_function: callable = None,
+  jobs: int = 4,
+  session = None,
+) -> Path:
+  # importing on-demand for faster overall import times
+  import requests
+  file = Path(file)
+  part_file = get_part_file(file)
+  segments_file = get_segments_file(file)
+  # Sharing one keep-alive session between all segments
+  if session is None:
+    with requests.Session() as session:
+      adapter = requests.adapters.HTTPAdapter(pool_maxsize=jobs)
+      session.mount('http://', adapter)
+      session.mount('https://', adapter)
+      return download_segmented(link, file, progress_function, jobs, session)
+  size = get_ranged_size(link, session)
+  if jobs < 2 or size is None or size < min_segment_size * 2:
+    return download(link, file, progress_function, session)
+  # Splitting the file into more segments than jobs, so that the threads
+  # which finish early can take over the remaining ones
+  segment_size = max(min_segment_size, -(-size // (jobs * 4)))
+  segments = [
+    (start, min(start + segment_size, size) - 1)
+    for start in range(0, size, segment_size)
+  ]
+  # Resuming
+  finished = set()
+  if part_file.is_file() and segments_file.is_file():
+    record = json.loads(segments_file.read_text())
+    if record.get('link') == link and record.get('size') == size:
+      finished = {tuple(segment) for segment in record.get('finished')}
+  if not finished:
+    with open(part_file, 'wb') as f:
+      f.truncate(size)
+  pending = [segment for segment in segments if segment not in finished]
+  # Tracking progress
+  lock = threading.Lock()
+  downloaded = sum([end - start + 1 for start, end in finished])
+  def add_progress(n_bytes: int):
+    nonlocal downloaded
+    with lock:
+      downloaded += n_bytes
+      if progress_function:
+        progress_function(downloaded, size)
+  # Downloading a single segment
+  def download_segment(segment: tuple):
+    start, end = segment
+    headers = {'Range': f'bytes={start}-{end}'}
+    with session.get(link, headers=headers, stream=True) as response:
+      if response.status_code != 206:
+        raise ConnectionError(
+          f"Error downloading '{link}'. Status code: {response.status_code}"
+        )
+      written = 0
+      with open(part_file, 'r+b') as f:
+        f.seek(start)
+        for chunk in response.iter_content(chunk_size):
+          f.write(chunk)
+          written += len(chunk)
+          add_progress(len(chunk))
+    if written != end - start + 1:
+      raise ConnectionError(f"Incomplete range downloaded from '{link}'")
+    with lock:
+      finished.add(segment)
+      segments_file.write_text(json.dumps({
+        'link': link,
+        'size': size,
+        'finished': sorted(finished),
+      }))
+  with ThreadPoolExecutor(jobs) as executor:
+    for _ in executor.map(download_segment, pending):
+      pass
+  segments_file.unlink(missing_ok=True)
+  part_file.replace(file)
+  return file
@@ -4,7 +4,14 @@ from libjam import notebook
 import os, re
 
 # Internal imports
-from . import data, utils, validate_functions, install_functions, factory
+from . import (
+  data,
+  utils,
+  size_cache,
+  validate_functions,
+  install_functions,
+  factory,
+)
 
 # CSP data
 re_csp_credits_tag = re.compile(r'\[/?[a-zA-Z0-9_]+(?:=[^\]]+)?\]')
@@ -34,7 +41,8 @@ def get_size(root: Path, items: list) -> int:
 def get_csp_size(self) -> int:
   extension_dir = self.path / 'extension'
   dwrite_file = self.path / 'dwrite.dll'
-  return utils.get_dir_size(extension_dir) + utils.get_file_size(dwrite_file)
+  extension_size = size_cache.get_dir_size(extension_dir)
+  return extension_size + utils.get_file_size(dwrite_file)
 
 def get_pure_size(self) -> int:
   all_files = data.get('pure-all-files')
@@ -1,13 +1,17 @@
 # Imports
 from pathlib import Path
+import functools
 
 # Relative imports
 from .shared import *
+from .archive_functions import VirtualPath
 
-# An __init__ function for all assigned assets.
+# An __init__ function for all assigned assets. Paths inside archives are
+# kept as VirtualPaths.
 def asset_init(self, path):
   # Checking given path
-  path = Path(path)
+  if not isinstance(path, VirtualPath):
+    path = Path(path)
   if not path.exists():
     raise FileNotFoundError(f"Path '{path}' does not exist")
   if not self.__validate__(path):
@@ -21,6 +25,53 @@ def asset_init(self, path):
     )
   self.path = path
 
+# Creates an asset object from a path that is already known to be valid,
+# skipping validation.
+def create_validated(asset_class, path):
+  asset = object.__new__(asset_class)
+  asset.path = Path(path)
+  return asset
+
+# Asset functions whose results are cached per asset, until its path changes
+# or refresh() is called.
+memoized_function_names = [
+  'get_origin',
+  'get_ui_info',
+  'get_lang',
+  'get_layouts',
+  'get_skins',
+  'get_size',
+]
+
+# Returns a version of given asset function which caches its result.
+# Copies of cached lists and dicts are returned, so that callers can not
+# modify the cached value.
+def memoize(function_name: str, function: callable) -> callable:
+  @functools.wraps(function)
+  def memoized_function(self):
+    memo = self._memo
+    if memo is None:
+      memo = self._memo = {}
+    if function_name not in memo:
+      memo[function_name] = function(self)
+    value = memo.get(function_name)
+    if type(value) in [list, dict]:
+      return value.copy()
+    return value
+  return memoized_function
+
+def get_asset_path(self) -> Path:
+  return self._path
+
+# Setting the path invalidates all cached results.
+def set_asset_path(self, path: Path):
+  self._path = path
+  self._memo = None
+
+# Clears all cached results.
+def asset_refresh(self):
+  self._memo = None
+
 def is_asset_path_valid(self) -> bool:
   if hasattr(self, 'path'):
     if hasattr(self.path, 'name'):
@@ -87,11 +138,19 @@ def create(container_name: str, asset_list: list):
       '__validate__': staticmethod(validate_function),
       '__install__':  staticmethod(install_function),
       '__repr__':  asset_repr,
+      'path': property(get_asset_path, set_asset_path),
+      'refresh': asset_refresh,
     }
-    asset_class = type(asset_name, (object,), {})
+    # Assets only ever hold their path and cached results, so slots are used
+    # instead of a per-instance __dict__ to keep large lists of assets small
+    asset_class = type(asset_name, (object,), {
+      '__slots__': ('_path', '_memo'),
+    })
     for key, value in custom_attributes.items():
       setattr(asset_class, key, value)
     for function_name, function in asset_functions.items():
+      if function_name in memoized_function_names:
+        function = memoize(function_name, function)
       setattr(asset_class, function_name, function)
     setattr(container, asset_name, asset_class)
   return container()
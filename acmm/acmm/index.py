@@ -0,0 +1,100 @@
+# Imports
+from pathlib import Path
+import sqlite3, threading, os
+
+# Shorthand vars
+schema = '''
+CREATE TABLE IF NOT EXISTS scanned_dirs (
+  class TEXT NOT NULL,
+  path TEXT NOT NULL,
+  mtime_ns INTEGER NOT NULL,
+  PRIMARY KEY (class, path)
+);
+CREATE TABLE IF NOT EXISTS candidates (
+  class TEXT NOT NULL,
+  path TEXT NOT NULL,
+  mtime_ns INTEGER NOT NULL,
+  valid INTEGER NOT NULL,
+  PRIMARY KEY (class, path)
+);
+'''
+
+# Returns the mtime of a given path, or None if it does not exist.
+def get_mtime(path: Path) -> int or None:
+  try:
+    return os.stat(path).st_mtime_ns
+  except OSError:
+    return None
+
+# A persistent index of fetched asset paths.
+#
+# For every asset class it remembers which directories were scanned and which
+# paths were found in them, along with their mtimes. Paths are only validated
+# again if their mtime has changed, and directories are only scanned again
+# if one of them has changed.
+class AssetIndex:
+  def __init__(self, file):
+    file = Path(file)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    self.file = file
+    self.lock = threading.Lock()
+    self.connection = sqlite3.connect(file, check_same_thread=False)
+    with self.lock, self.connection:
+      self.connection.executescript(schema)
+
+  # Returns True if none of the directories scanned for asset_class changed.
+  def is_scan_current(self, key: str) -> bool:
+    scanned_dirs = self.connection.execute(
+      'SELECT path, mtime_ns FROM scanned_dirs WHERE class = ?', (key,),
+    ).fetchall()
+    if not scanned_dirs:
+      return False
+    for path, mtime in scanned_dirs:
+      if get_mtime(path) != mtime:
+        return False
+    return True
+
+  # Scans given root with fetch_function and replaces the stored candidates.
+  def rescan(self, key: str, root: Path, fetch_function: callable) -> dict:
+    paths = list(fetch_function(root))
+    scanned_dirs = {root} | {path.parent for path in paths}
+    self.connection.execute('DELETE FROM scanned_dirs WHERE class = ?', (key,))
+    self.connection.executemany(
+      'INSERT INTO scanned_dirs VALUES (?, ?, ?)',
+      [(key, str(path), get_mtime(path)) for path in scanned_dirs],
+    )
+    stored = dict(self.get_candidates(key))
+    self.connection.execute('DELETE FROM candidates WHERE class = ?', (key,))
+    return {str(path): stored.get(str(path), (None, None)) for path in paths}
+
+  # Returns a dict of stored candidate paths and their (mtime, valid) pairs.
+  def get_candidates(self, key: str) -> dict:
+    rows = self.connection.execute(
+      'SELECT path, mtime_ns, valid FROM candidates WHERE class = ?', (key,),
+    )
+    return {path: (mtime, valid) for path, mtime, valid in rows}
+
+  # Returns valid asset paths for asset_class in root, revalidating only the
+  # paths which changed since the last call.
+  def fetch(self, asset_class, root: Path) -> list[Path]:
+    key = asset_class.__name__
+    with self.lock, self.connection:
+      if self.is_scan_current(key):
+        candidates = self.get_candidates(key)
+      else:
+        candidates = self.rescan(key, root, asset_class.__fetch__)
+      rows = []
+      valid_paths = []
+      for path, (stored_mtime, valid) in candidates.items():
+        mtime = get_mtime(path)
+        if mtime is None:
+          continue
+        if mtime != stored_mtime:
+          valid = asset_class.__validate__(Path(path))
+        rows.append((key, path, mtime, int(valid)))
+        if valid:
+          valid_paths.append(Path(path))
+      self.connection.executemany(
+        'INSERT OR REPLACE INTO candidates VALUES (?, ?, ?, ?)', rows,
+      )
+    return valid_paths
@@ -1,44 +1,83 @@
 # Imports
 from pathlib import Path
-import shutil
+import os
 
 # Internal imports
+from . import utils, copy_functions
 from .shared import *
 
 # Install functions
+
+# Installs a given file or directory into destination. Options:
+# - move: the source is renamed into place instead of copied, which requires
+#   it to be on the same filesystem and leaves nothing behind at the source.
+#   Otherwise files are copied with copy_functions.copy_file.
+# - hardlink: files are hardlinked instead of copied where possible.
+# - compare_hash: with InstallMethod.UPDATE, files with the same size but a
+#   different mtime are compared by their contents before being replaced.
+# - change_function: called with the installed path and a FileChange for
+#   every file which is added or modified.
+# - jobs: how many files are transferred at once.
+# - progress_function: called with the number of transferred and total bytes.
+# InstallMethod.LINK replaces the target with a symlink to the source.
 def base_install(
   source: Path, destination: Path, install_method: InstallMethod,
-) -> str:
-  if install_method is InstallMethod.CLEAN:
-    if destination.exists():
-      destination.unlink()
-    source.copy_into(destination)
-  elif install_method is InstallMethod.UPDATE:
-    if source.is_dir():
-      destination = destination / source.name
-      shutil.copytree(source, destination, dirs_exist_ok=True)
-    else:
-      source.copy_into(destination)
-  else:
+  move: bool = False,
+  hardlink: bool = False,
+  compare_hash: bool = False,
+  change_function: callable = None,
+  jobs: int = None,
+  progress_function: callable = None,
+):
+  target = destination / source.name
+  # Installing an asset from where it is installed would delete it before
+  # it is copied or linked, but it is already in place. So is a source which
+  # the target links to, when installing it as a link.
+  if os.path.lexists(target) and source.resolve() == target.resolve():
+    is_link = target.is_symlink() and source.absolute() != target.absolute()
+    if not is_link or install_method is InstallMethod.LINK:
+      return
+  if install_method in [InstallMethod.CLEAN, InstallMethod.LINK]:
+    if target.is_dir() and not target.is_symlink():
+      utils.unlink_dir(target)
+    elif target.exists() or target.is_symlink():
+      target.unlink()
+  elif install_method is not InstallMethod.UPDATE:
     raise ValueError(f"Invalid install_method '{install_method}'")
+  elif target.is_symlink():
+    # Updating a linked asset would write into the library it links to
+    target.unlink()
+  if install_method is InstallMethod.LINK:
+    os.symlink(source.absolute(), target, target_is_directory=source.is_dir())
+    return
+  if move:
+    transfer_function = os.replace
+  else:
+    transfer_function = copy_functions.get_copy_function(hardlink)
+  copy_functions.update_path(
+    source, target, transfer_function, compare_hash, change_function,
+    jobs, progress_function,
+  )
 
 def install_generic(
   asset_path: Path, install_dir: str, install_method: InstallMethod,
+  **options,
 ) -> Path:
   # Getting info
-  base_install(asset_path, install_dir, install_method)
+  base_install(asset_path, install_dir, install_method, **options)
   return install_dir / asset_path.name
 
 def install_app(
   asset_path: Path, install_dir: str, install_method: InstallMethod,
+  **options,
 ) -> Path:
   # Getting info
   lang_to_dir = {
     AppLang.PYTHON: 'python',
     AppLang.LUA: 'lua',
   }
-  py_file = asset_path / asset_path.name + '.py'
-  lua_file = asset_path / asset_path.name + '.lua'
+  py_file = asset_path / (asset_path.name + '.py')
+  lua_file = asset_path / (asset_path.name + '.lua')
   if py_file.is_file():
     lang = AppLang.PYTHON
   elif lua_file.is_file():
@@ -47,33 +86,47 @@ def install_app(
     raise FileNotFoundError("Could not find the app's script file")
   lang_dir = lang_to_dir.get(lang)
   install_dir = install_dir / lang_dir
-  base_install(asset_path, install_dir, install_method)
+  base_install(asset_path, install_dir, install_method, **options)
   return install_dir / asset_path.name
 
 def install_csp(
   asset_path: Path, install_dir: Path, install_method: InstallMethod,
+  **options,
 ) -> Path:
   dwrite_file = asset_path / 'dwrite.dll'
   extension_dir = asset_path / 'extension'
   for destination in [dwrite_file, extension_dir]:
-    base_install(destination, install_dir, install_method)
+    base_install(destination, install_dir, install_method, **options)
   return install_dir
 
-def install_extension_generic(asset_path: Path, install_dir: Path) -> Path:
+# Pure and SOL are merged into directories shared with other assets, so they
+# can not be installed as links.
+def install_extension_generic(
+  asset_path: Path, install_dir: Path, install_method: InstallMethod,
+  **options,
+) -> Path:
+  if install_method is InstallMethod.LINK:
+    raise ValueError(f"Invalid install_method '{install_method}'")
   apps_dir = asset_path / 'apps'
   content_dir = asset_path / 'content'
   extension_dir = asset_path / 'extension'
   system_dir = asset_path / 'system'
   for destination in [apps_dir, content_dir, extension_dir, system_dir]:
-    base_install(destination, install_dir, InstallMethod.UPDATE)
+    base_install(destination, install_dir, InstallMethod.UPDATE, **options)
   return install_dir
 
 def install_pure(
   asset_path: Path, install_dir: Path, install_method: InstallMethod,
+  **options,
 ) -> Path:
-  return install_extension_generic(asset_path, install_dir)
+  return install_extension_generic(
+    asset_path, install_dir, install_method, **options,
+  )
 
 def install_sol(
   asset_path: Path, install_dir: Path, install_method: InstallMethod,
+  **options,
 ) -> Path:
-  return install_extension_generic(asset_path, install_dir)
+  return install_extension_generic(
+    asset_path, install_dir, install_method, **options,
+  )
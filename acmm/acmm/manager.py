@@ -1,42 +1,267 @@
 # Imports
 from pathlib import Path
-import pycountry
+from libjam import notebook
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os, json, time, tempfile, threading, contextlib
 
 # Internal imports
-from . import utils
+from . import utils, factory, validate_functions, size_cache
+from . import download_functions
 from .shared import *
 from .subassets import SubAsset
 from .assets import Asset
 from .extensions import Extension
+from .index import AssetIndex
+from .archive_cache import ArchiveCache
+from .trash import Trash
+from .archive_functions import Archive, VirtualPath
+
+# Links
+csp_base_link = 'https://acstuff.club/patch/'
+
+# CSP versions which are known to exist, used as starting points when
+# searching for released versions
+csp_known_versions = ['0.1.75']
+# How many patches are tried when looking for the start of a minor version
+csp_first_patches = 8
+# How many seconds a cached list of CSP versions is used without revalidating
+csp_versions_max_age = 24 * 60 * 60
+# How many connections are used at once when downloading a CSP archive
+csp_download_jobs = 4
+# How many bytes of downloaded archives are kept in the cache_dir
+archive_cache_max_size = 2 * 1024 * 1024 * 1024
+# How long and how many bytes of removed assets are kept in the trash
+trash_max_age = 30 * 24 * 60 * 60
+trash_max_size = 20 * 1024 * 1024 * 1024
+# The file inside a pending-delete dir which is locked while the dir is used
+pending_lock_basename = '.lock'
+# How many seconds a pending-delete dir whose lock can not be checked is left
+# alone, in case another process is still using it
+pending_min_age = 24 * 60 * 60
 
 # Internal functions
+def version_to_string(version: tuple) -> str:
+  return '.'.join([str(n) for n in version])
+
+def string_to_version(version_string: str) -> tuple:
+  return tuple([int(n) for n in version_string.split('.')])
+
 def find_assets_in_dir(self, path: Path) -> list:
   # Vars
   findable_classes = Extension.get_classes() + Asset.get_classes()
-  subpaths = [path] + utils.get_paths_recursive(path)
-  path_str = str(path)
-  found_paths = []
+  file_validators = validate_functions.file_validators
+  claimed_paths = set()
   assets = []
-  # Main loop
-  for asset_class in findable_classes:
-    for subpath in subpaths:
-      subpath_relative = str(subpath).removeprefix(path_str)
-      is_subpath = False
-      for found_path in found_paths:
-        if subpath_relative.startswith(found_path):
-          is_subpath = True
-          break
-      if is_subpath:
+  # Tries every findable class on the given path, returns True on success
+  def claim(subpath: Path, is_file: bool) -> bool:
+    for asset_class in findable_classes:
+      expects_file = asset_class.__validate__ in file_validators
+      if expects_file is not is_file:
         continue
       try:
         asset = asset_class(subpath)
       except InvalidAsset:
         continue
       assets.append(asset)
-      found_paths.append(subpath_relative)
+      return True
+    return False
+  # Walking the tree once, without descending into claimed directories
+  if claim(path, False):
+    return assets
+  def is_unclaimed(entry: os.DirEntry) -> bool:
+    return entry.path not in claimed_paths
+  for entry in utils.walk(path, descend=is_unclaimed):
+    if isinstance(entry, VirtualPath):
+      subpath = entry
+    else:
+      subpath = Path(entry.path)
+    if claim(subpath, not entry.is_dir()):
+      claimed_paths.add(entry.path)
   # Returning
   return assets
 
+# Deletes given paths and assets in a pool of up to `jobs` threads.
+# progress_function is called with the number of deleted and total items.
+def delete_items(
+  items: list[Path or Asset or Extension],
+  jobs: int = None,
+  progress_function: callable = None,
+):
+  def delete(item: Path or Asset or Extension):
+    if isinstance(item, Path):
+      if item.is_dir() and not item.is_symlink():
+        utils.unlink_dir(item)
+      else:
+        item.unlink(missing_ok=True)
+    else:
+      item.delete()
+  done = 0
+  with ThreadPoolExecutor(jobs) as executor:
+    futures = [executor.submit(delete, item) for item in items]
+    for future in as_completed(futures):
+      future.result()
+      done += 1
+      if progress_function:
+        progress_function(done, len(items))
+
+# Locks a given open file for as long as it stays open. Returns whether it
+# was locked, or None if locking is not supported.
+def try_lock(file) -> bool or None:
+  try:
+    # importing on-demand, since fcntl is not available on Windows
+    import fcntl
+  except ImportError:
+    return None
+  try:
+    fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+  except BlockingIOError:
+    return False
+  return True
+
+# Returns whether a given pending-delete dir was left behind by an
+# interrupted deletion. A dir whose lock is held is still being used. If the
+# lock can not be checked, only dirs older than pending_min_age are taken.
+def is_pending_leftover(path: Path) -> bool:
+  try:
+    with open(path / pending_lock_basename, 'rb') as lock_file:
+      locked = try_lock(lock_file)
+  except (FileNotFoundError, NotADirectoryError):
+    locked = None
+  if locked is not None:
+    return locked
+  try:
+    return time.time() - os.lstat(path).st_mtime > pending_min_age
+  except FileNotFoundError:
+    return False
+
+# Searches for released CSP versions and returns them in ascending order.
+# Patches of a minor version are expected to be contiguous, so only the first
+# and the last patch of every minor version are searched for: starting from
+# `known_versions`, galloping ahead until a patch is missing and then
+# bisecting. This takes a logarithmic number of requests per minor version.
+# The patches in between which were not probed are checked with a HEAD
+# request of their download, so that gaps are left out. After the last minor
+# version, the first minor version of the next major version is looked for.
+# Known versions of minor versions older than the latest known one are taken
+# as they are. Up to `jobs` requests are sent at once over a shared
+# keep-alive session.
+def search_csp_versions(
+  known_versions: list[str], base_link: str, jobs: int,
+) -> list[str]:
+  # importing on-demand for faster overall import times
+  import requests
+  info_link = base_link + '?info='
+  get_link = base_link + '?get='
+  # Known patches of every minor version
+  known_patches = {}
+  for version_string in csp_known_versions + known_versions:
+    major, minor, patch = string_to_version(version_string)
+    known_patches.setdefault((major, minor), set()).add(patch)
+  # Versions which are known or were probed to exist
+  confirmed = {
+    (major, minor, patch)
+    for (major, minor), patches in known_patches.items() for patch in patches
+  }
+  # Sharing one keep-alive session between all probes
+  session = requests.Session()
+  adapter = requests.adapters.HTTPAdapter(pool_maxsize=jobs)
+  session.mount('http://', adapter)
+  session.mount('https://', adapter)
+  executor = ThreadPoolExecutor(jobs)
+  # Returns whether a given version exists
+  def probe(version: tuple) -> bool:
+    request = session.get(info_link + version_to_string(version))
+    if request.status_code != 200:
+      raise ConnectionError()
+    exists = request.text != 'Unknown version'
+    if exists:
+      confirmed.add(version)
+    return exists
+  # Returns whether the download of a given version exists
+  def check(version: tuple) -> bool:
+    request = session.head(
+      get_link + version_to_string(version), allow_redirects=True,
+    )
+    if request.status_code == 404:
+      return False
+    if not request.ok:
+      raise ConnectionError()
+    return True
+  # Probes the given patches of a minor version concurrently. Returns the
+  # last patch that exists and the first one that does not, going through
+  # the results in order.
+  def probe_patches(
+    major: int, minor: int, patches: list, last: int, missing: int,
+  ) -> tuple[int, int or None]:
+    versions = [(major, minor, patch) for patch in patches]
+    for patch, exists in zip(patches, executor.map(probe, versions)):
+      if not exists:
+        return last, patch
+      last = patch
+    return last, missing
+  # Returns the last patch of a minor version, given one that exists
+  def find_last_patch(
+    major: int, minor: int, last: int, missing: int = None,
+  ) -> int:
+    # Galloping
+    step = 1
+    while missing is None:
+      patches = [last + (step << i) for i in range(jobs)]
+      step <<= jobs
+      last, missing = probe_patches(major, minor, patches, last, None)
+    # Bisecting
+    while missing - last > 1:
+      span = missing - last
+      patches = {last + span * i // (jobs + 1) for i in range(1, jobs + 1)}
+      patches = sorted([patch for patch in patches if last < patch < missing])
+      last, missing = probe_patches(major, minor, patches, last, missing)
+    return last
+  # Main loop
+  found = []
+  major, minor = min(known_patches)
+  latest_known = max(known_patches)
+  with session, executor:
+    while True:
+      patches = known_patches.get((major, minor))
+      if patches and (major, minor) < latest_known:
+        # Minor versions older than the latest known one are complete
+        for patch in sorted(patches):
+          found.append(version_to_string((major, minor, patch)))
+        minor += 1
+        continue
+      if patches:
+        first = min(patches)
+        last = find_last_patch(major, minor, max(patches))
+      else:
+        # Looking for the start of a new minor version
+        patches = list(range(csp_first_patches))
+        versions = [(major, minor, patch) for patch in patches]
+        results = list(executor.map(probe, versions))
+        if True not in results:
+          if minor == 0:
+            break
+          # Looking for the start of the next major version instead
+          major, minor = major + 1, 0
+          continue
+        first = results.index(True)
+        last, missing = probe_patches(
+          major, minor, patches[first + 1:], first, None,
+        )
+        last = find_last_patch(major, minor, last, missing)
+      # Checking the patches which were only assumed to exist
+      versions = [(major, minor, patch) for patch in range(first, last + 1)]
+      unchecked = [version for version in versions if version not in confirmed]
+      missing = {
+        version
+        for version, exists in zip(unchecked, executor.map(check, unchecked))
+        if not exists
+      }
+      for version in versions:
+        if version not in missing:
+          found.append(version_to_string(version))
+      minor += 1
+  return found
+
 
 # Manages assets for Assetto Corsa.
 class Manager:
@@ -60,8 +285,23 @@ class Manager:
         )
     return assetto_dir
 
-  def __init__(self, assetto_dir):
+  # If cache_dir is given, fetched assets are kept in a persistent index
+  # there, so that only changed directories are validated on later fetches.
+  # Directory sizes and downloaded archives are cached there as well.
+  def __init__(self, assetto_dir, cache_dir=None):
     self.assetto_dir = self.check_assetto_dir(assetto_dir)
+    self.cache_dir = cache_dir
+    if cache_dir is None:
+      self.index = None
+      self.archive_cache = None
+    else:
+      cache_dir = self.cache_dir = Path(cache_dir)
+      self.index = AssetIndex(cache_dir / 'index.sqlite')
+      self.archive_cache = ArchiveCache(
+        cache_dir / 'archives', archive_cache_max_size,
+      )
+      size_cache.enable(cache_dir / 'sizes.sqlite')
+    self.trash_bin = Trash(self.assetto_dir / '.acmm' / 'trash')
 
   def fetch_assets(self, asset_class: Asset = None) -> list:
     if asset_class is None:
@@ -72,6 +312,12 @@ class Manager:
     fetch_function = asset_class.__fetch__
     pathlist = asset_class.__pathlist__
     path = self.assetto_dir / Path(*pathlist)
+    if self.index is not None:
+      valid_paths = self.index.fetch(asset_class, path)
+      return [
+        factory.create_validated(asset_class, subpath)
+        for subpath in valid_paths
+      ]
     found_paths = fetch_function(path)
     assets = []
     for subpath in found_paths:
@@ -82,81 +328,454 @@ class Manager:
         continue
     return assets
 
+  # Computes the sizes of given assets in a pool of up to `jobs` threads and
+  # yields (asset, size) pairs in the order they complete.
+  def get_sizes(
+    self, assets: list[Asset or Extension], jobs: int = None,
+  ) -> iter[tuple]:
+    with ThreadPoolExecutor(jobs) as executor:
+      futures = {executor.submit(asset.get_size): asset for asset in assets}
+      for future in as_completed(futures):
+        yield futures[future], future.result()
+
   def fetch_extension(self, extension_class: Extension) -> Extension:
     try:
       return extension_class(self.assetto_dir)
     except InvalidAsset:
       return None
 
-  def fetch_csp_versions(self) -> dict:
-    # importing on-demand for faster overall import times
-    import requests
-    # links
-    base_link =  'https://acstuff.club/patch/'
-    info_link = base_link + '?info='
+  # Fetches released CSP versions and returns a dict of them in ascending
+  # order. Every version has a 'download-link', its info can be fetched with
+  # fetch_csp_info. If the manager has a cache_dir, the list of versions is
+  # kept there. A list younger than `max_age` seconds is returned without any
+  # requests, and an older one is revalidated by searching onwards from the
+  # cached versions. If that fails the cached list is returned, so that the versions
+  # are also available offline. `base_link` can be pointed at a local server
+  # for testing.
+  def fetch_csp_versions(
+    self,
+    max_age: float = csp_versions_max_age,
+    base_link: str = csp_base_link,
+    jobs: int = 8,
+  ) -> dict:
+    # Reading the cached list
+    cached = None
+    if self.cache_dir is not None:
+      versions_file = self.cache_dir / 'csp-versions.json'
+      try:
+        cached = notebook.read_json(str(versions_file))
+      except (OSError, ValueError):
+        # A missing or corrupt list is fetched again
+        cached = None
+      if cached is not None and cached.get('base-link') != base_link:
+        cached = None
+    # Revalidating
+    if cached is not None and time.time() - cached.get('fetched') < max_age:
+      version_strings = cached.get('versions')
+    else:
+      known_versions = cached.get('versions') if cached else []
+      try:
+        version_strings = search_csp_versions(known_versions, base_link, jobs)
+      except OSError:
+        if cached is None:
+          raise
+        version_strings = cached.get('versions')
+      else:
+        if self.cache_dir is not None:
+          self.cache_dir.mkdir(parents=True, exist_ok=True)
+          notebook.write_json(str(versions_file), {
+            'base-link': base_link,
+            'fetched': time.time(),
+            'versions': version_strings,
+          }, overwrite=True)
+    # Returning
     get_link = base_link + '?get='
-    # Version start and end positions
-    version = [0, 1, 75]
-    cutoff = (0, 3, 0)
-    found_lead = False
-    # Main loop
     found = {}
-    while True:
-      version_string = '.'.join([str(n) for n in version])
-      link = info_link + version_string
-      request = requests.get(link)
-      if request.status_code != 200:
-          raise ConnectionError()
-      if request.text != 'Unknown version':
-        found_lead = True
-        found[version_string] = {
-          'info': request.content,
-          'download-link': get_link + version_string,
-        }
-        version[2] += 1
-      else:
-        if (
-          version[0] >= cutoff[0] and
-          version[1] >= cutoff[1] and
-          version[2] >= cutoff[2]
-        ):
-          break
-        if found_lead:
-          version[1] += 1
-          version[2] = 0
-        else:
-          version[2] += 1
-        found_lead = False
+    for version_string in version_strings:
+      found[version_string] = {
+        'download-link': get_link + version_string,
+      }
     return found
 
+  # Returns the info of a given CSP version, as served by acstuff.club. If the
+  # manager has a cache_dir, the info is kept there and only fetched once.
+  # Cached info which is missing or not valid json is fetched again.
+  def fetch_csp_info(
+    self, version_string: str, base_link: str = csp_base_link,
+  ) -> bytes:
+    if self.cache_dir is not None:
+      info_file = self.cache_dir / 'csp-info' / version_string
+      try:
+        info = info_file.read_bytes()
+        json.loads(info)
+        return info
+      except (OSError, ValueError):
+        pass
+    # importing on-demand for faster overall import times
+    import requests
+    request = requests.get(base_link + '?info=' + version_string)
+    if request.status_code != 200:
+      raise ConnectionError()
+    if request.text == 'Unknown version':
+      raise ValueError(f"Unknown CSP version '{version_string}'")
+    if self.cache_dir is not None:
+      # Writing to a temporary file first, so that an interrupted write does
+      # not leave a truncated file behind
+      info_file.parent.mkdir(parents=True, exist_ok=True)
+      temp_file = info_file.with_name(f'.{info_file.name}.acmm-part')
+      temp_file.write_bytes(request.content)
+      os.replace(temp_file, info_file)
+    return request.content
+
+  # Downloads the archive of a given CSP version to `directory` and returns
+  # the archive file. If no directory is given, the archive is kept in the
+  # manager's archive cache instead, and returned from there without any
+  # network I/O when the same version is requested again.
+  # The archive is streamed to disk in byte ranges over up to `jobs`
+  # connections, and an interrupted download is resumed on the next call.
+  # progress_function is called with the downloaded and total number of bytes.
+  def download_csp(
+    self,
+    version_string: str,
+    directory: Path = None,
+    progress_function: callable = None,
+    base_link: str = csp_base_link,
+    jobs: int = csp_download_jobs,
+  ) -> Path:
+    link = base_link + '?get=' + version_string
+    use_cache = directory is None
+    if use_cache:
+      if self.archive_cache is None:
+        raise ValueError('No directory given and the manager has no cache_dir')
+      cached_file = self.archive_cache.get(link)
+      if cached_file is not None:
+        return cached_file
+      directory = self.cache_dir / 'downloads'
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    file = directory / f'csp-{version_string}'
+    if not file.is_file():
+      download_functions.download_segmented(link, file, progress_function, jobs)
+    if use_cache:
+      return self.archive_cache.add(link, file)
+    return file
+
+  # Finds assets in given directories and archives. Archives are searched
+  # by their listing alone, without extracting them, and the assets found in
+  # them have VirtualPaths. Use extract_assets before installing them, which
+  # also closes the archives.
   def find_assets(self, paths: list) -> list[Asset or Extension]:
     # Validating given paths
     for i in range(len(paths)):
       path = Path(paths[i])
       if not path.exists():
         raise FileNotFoundError(f"File '{path}' not found")
-      if not path.is_dir():
-        raise NotADirectoryError(f"Path '{path}' does not lead to a directory")
-      paths[i] = path
-    # Searching for assets
+      if path.is_dir():
+        paths[i] = path
+      else:
+        paths[i] = Archive(path).get_root()
+    # Searching for assets, archives without any are closed right away
     assets = []
     for path in paths:
-      assets += find_assets_in_dir(self, path)
+      found = find_assets_in_dir(self, path)
+      if isinstance(path, VirtualPath) and not found:
+        path.archive.close()
+      assets += found
+    return assets
+
+  # Extracts given assets which were found inside archives into destination,
+  # and points them to their extracted paths. Only the members of the assets
+  # themselves are extracted, leaving out the rest of the archive and junk
+  # such as '__MACOSX' dirs. Every archive is extracted into a directory
+  # named after it, inside a directory named after its position, so that
+  # archives with the same name do not share one. Up to `jobs` archives are extracted at once,
+  # and progress_function is called with the number of extracted and total
+  # bytes of all archives.
+  def extract_assets(
+    self,
+    assets: list[Asset or Extension],
+    destination: Path,
+    progress_function: callable = None,
+    jobs: int = None,
+  ) -> list[Asset or Extension]:
+    for _ in self.extract_assets_as_completed(
+      assets, destination, progress_function, jobs,
+    ):
+      pass
     return assets
 
+  # Same as extract_assets, but yields the assets of every archive as a list
+  # as soon as that archive has been extracted, so that they can be worked on
+  # while the other archives are still being extracted. Assets which are not
+  # inside archives are yielded right away. Closing the generator, such as
+  # on a KeyboardInterrupt, stops the running extractions at their next
+  # chunk and waits for them. 7z archives are extracted in one go, so they
+  # are waited for until they are done.
+  def extract_assets_as_completed(
+    self,
+    assets: list[Asset or Extension],
+    destination: Path,
+    progress_function: callable = None,
+    jobs: int = None,
+  ) -> iter[list]:
+    destination = Path(destination)
+    archived_assets = {}
+    unarchived_assets = []
+    for asset in assets:
+      if isinstance(asset.path, VirtualPath):
+        archived_assets.setdefault(asset.path.archive, []).append(asset)
+      else:
+        unarchived_assets.append(asset)
+    # Listing the members to extract
+    archive_names = {}
+    for archive, assets_in_archive in archived_assets.items():
+      archive_names[archive] = archive.get_tree_names([
+        asset.path.member_name for asset in assets_in_archive
+      ])
+    # Tracking the progress of all archives together
+    lock = threading.Lock()
+    archive_done = {archive: 0 for archive in archived_assets}
+    total = sum([
+      archive.members.get(name).size
+      for archive, names in archive_names.items() for name in names
+    ])
+    done = 0
+    stopped = threading.Event()
+    # Extracts a single archive
+    def extract_archive(i: int, archive: Archive) -> list:
+      def add_progress(archive_progress: int, archive_total: int):
+        nonlocal done
+        if stopped.is_set():
+          raise InterruptedError('Extraction stopped')
+        with lock:
+          done += archive_progress - archive_done.get(archive)
+          archive_done[archive] = archive_progress
+          if progress_function:
+            progress_function(done, total)
+      archive_dir = destination / str(i) / archive.file.stem
+      archive.extract(archive_dir, archive_names.get(archive), add_progress)
+      assets_in_archive = archived_assets.get(archive)
+      for asset in assets_in_archive:
+        asset_id = asset.get_id()
+        asset.path = archive_dir / asset.path.member_name
+        # Assets are installed under the name they were found with
+        assert asset.get_id() == asset_id
+      return assets_in_archive
+    # Extracting
+    executor = ThreadPoolExecutor(jobs)
+    try:
+      futures = [
+        executor.submit(extract_archive, i, archive)
+        for i, archive in enumerate(archived_assets)
+      ]
+      if unarchived_assets:
+        yield unarchived_assets
+      for future in as_completed(futures):
+        yield future.result()
+    finally:
+      stopped.set()
+      executor.shutdown(cancel_futures=True)
+      for archive in archived_assets:
+        archive.close()
+
+  # Returns a temporary directory for staging assets before they are
+  # installed, to be used as a context manager. It is created inside the
+  # assetto_dir, so that installing assets from it is a rename on the same
+  # filesystem instead of a copy.
+  def get_staging_dir(self) -> tempfile.TemporaryDirectory:
+    staging_root = self.assetto_dir / '.acmm' / 'staging'
+    staging_root.mkdir(parents=True, exist_ok=True)
+    return tempfile.TemporaryDirectory(prefix='acmm-', dir=staging_root)
+
+  # Returns whether a given path is inside a staging directory.
+  def is_staged(self, path: Path) -> bool:
+    staging_root = self.assetto_dir / '.acmm' / 'staging'
+    return Path(path).is_relative_to(staging_root)
+
+  # Installs a given asset. Assets inside a staging directory are moved into
+  # place, all others are copied. Copies are made as reflinks where the
+  # filesystem supports them. With hardlink, files are hardlinked instead of
+  # copied if possible, so the installed files share their data with the
+  # originals and changing one changes the other. InstallMethod.LINK installs
+  # a symlink to the asset instead, for assets kept in a library elsewhere.
+  # InstallMethod.UPDATE only replaces files which differ in size or mtime,
+  # or with compare_hash, in contents. change_function is called with the
+  # path and a FileChange for every file which was added or modified.
+  # Files are transferred in a pool of up to `jobs` threads, largest first,
+  # and progress_function is called with the transferred and total bytes.
   def install(
     self,
     asset: Asset or Extension,
     install_method: InstallMethod,
+    hardlink: bool = False,
+    compare_hash: bool = False,
+    change_function: callable = None,
+    jobs: int = None,
+    progress_function: callable = None,
   ) -> Asset or Extension:
     asset_class = type(asset)
     install_function = asset_class.__install__
     pathlist = asset_class.__pathlist__
     install_dir = self.assetto_dir / Path(*pathlist)
-    asset.path = install_function(asset.path, install_dir, install_method)
+    if isinstance(asset.path, VirtualPath):
+      raise ValueError(
+        f"Asset at '{asset.path}' is inside an archive, "
+        'it has to be extracted with extract_assets first'
+      )
+    move = self.is_staged(asset.path)
+    if move and install_method is InstallMethod.LINK:
+      raise ValueError(
+        f"Asset at '{asset.path}' is staged, it can not be installed as a link"
+      )
+    asset.path = install_function(
+      asset.path, install_dir, install_method,
+      move=move,
+      hardlink=hardlink,
+      compare_hash=compare_hash,
+      change_function=change_function,
+      jobs=jobs,
+      progress_function=progress_function,
+    )
+    # Files may have been overwritten in place, which the size cache can not
+    # detect by itself
+    size_cache.forget(asset.path)
     return asset
 
+  # Creates a new dir inside the assetto_dir to rename paths into before they
+  # are deleted, to be used as a context manager. Yields the dir along with
+  # the leftovers of earlier deletions which were interrupted, which are
+  # moved into it and should be deleted with the rest. The dir is locked
+  # while it is used, so that other processes do not take it as a leftover,
+  # and it is removed once it is empty.
+  @contextlib.contextmanager
+  def get_pending_delete_dir(self) -> iter[tuple[Path, list[Path]]]:
+    pending_root = self.assetto_dir / '.acmm' / 'pending-delete'
+    pending_root.mkdir(parents=True, exist_ok=True)
+    batch_dir = Path(tempfile.mkdtemp(prefix='acmm-', dir=pending_root))
+    lock_path = batch_dir / pending_lock_basename
+    # Locking before the lock file gets its name, so that it is never seen
+    # unlocked while the dir is used
+    new_lock_path = lock_path.with_name(pending_lock_basename + '.new')
+    lock_file = open(new_lock_path, 'wb')
+    try:
+      try_lock(lock_file)
+      os.rename(new_lock_path, lock_path)
+      # Taking over leftovers, only one process can rename each of them
+      leftovers = []
+      for entry in os.scandir(pending_root):
+        path = Path(entry.path)
+        if path == batch_dir or not is_pending_leftover(path):
+          continue
+        leftover = batch_dir / f'leftover-{entry.name}'
+        try:
+          os.rename(path, leftover)
+        except FileNotFoundError:
+          continue
+        leftovers.append(leftover)
+      yield batch_dir, leftovers
+    finally:
+      lock_file.close()
+      # A dir which could not be emptied is left for a later deletion, which
+      # can take it over right away since it is no longer locked
+      try:
+        if [entry.name for entry in os.scandir(batch_dir)] == [pending_lock_basename]:
+          lock_path.unlink()
+          batch_dir.rmdir()
+      except FileNotFoundError:
+        pass
+
+  # Removes given assets and returns them. Every asset is first renamed into
+  # a pending-delete dir inside the assetto_dir, which is instant and makes
+  # all of them disappear from the game at once, and the renamed assets are
+  # then deleted in a pool of up to `jobs` threads. Leftovers of removals
+  # which were interrupted are deleted along with them. Assets which can not
+  # be renamed, such as extensions spread over several dirs, are deleted in
+  # place. progress_function is called with the number of deleted and total
+  # assets.
+  def remove(
+    self,
+    assets: list[Asset or Extension],
+    jobs: int = None,
+    progress_function: callable = None,
+  ) -> list[Asset or Extension]:
+    with self.get_pending_delete_dir() as (batch_dir, leftovers):
+      # Renaming
+      renamed = []
+      in_place = []
+      for i, asset in enumerate(assets):
+        if type(asset) not in Asset.get_classes():
+          in_place.append(asset)
+          continue
+        pending_path = batch_dir / f'{i}-{asset.path.name}'
+        try:
+          os.rename(asset.path, pending_path)
+        except OSError:
+          in_place.append(asset)
+        else:
+          renamed.append(pending_path)
+        size_cache.forget(asset.path)
+      # Deleting
+      delete_items(renamed + in_place + leftovers, jobs, progress_function)
+    return assets
+
+  # Moves given assets into the trash inside the assetto_dir and returns the
+  # info of their trash entries. Trashing an asset is a single rename, as is
+  # restoring it with restore. Only assets in a single dir can be trashed.
+  def trash(self, assets: list[Asset]) -> list[dict]:
+    for asset in assets:
+      if type(asset) not in Asset.get_classes():
+        raise ValueError(f"Asset at '{asset.path}' can not be trashed")
+    infos = []
+    for asset in assets:
+      info = self.trash_bin.add(asset.path, {
+        'asset-class': type(asset).__name__,
+        'asset-id': asset.get_id(),
+      })
+      size_cache.forget(asset.path)
+      infos.append(info)
+    return infos
+
+  # Returns the info of every trash entry, oldest first. Besides the
+  # 'asset-class' and 'asset-id' of the trashed asset, every info holds the
+  # 'id' of its entry, the original 'path' and the time it was 'trashed' at.
+  def get_trash(self) -> list[dict]:
+    return self.trash_bin.get_entries()
+
+  # Moves the asset of a given trash entry back into place and returns it.
+  def restore(self, trash_id: int) -> Asset:
+    info = self.trash_bin.restore(trash_id)
+    asset_class = getattr(Asset, info.get('asset-class'))
+    return asset_class(info.get('path'))
+
+  # Deletes the oldest trash entries until none are older than `max_age`
+  # seconds and they take up at most `max_size` bytes, and returns their info.
+  # Either limit can be None to not apply it, and a max_size of 0 empties the
+  # trash. The sizes of the entries are only computed for a max_size above 0,
+  # which walks every entry the first time. Entries whose ids are in `keep`,
+  # such as the ones just returned by trash, are never deleted and do not
+  # count towards max_size. The entries are deleted like the assets given to
+  # remove, jobs and progress_function are passed on the same way.
+  def purge_trash(
+    self,
+    max_size: int = trash_max_size,
+    max_age: float = trash_max_age,
+    keep: list[int] = None,
+    jobs: int = None,
+    progress_function: callable = None,
+  ) -> list[dict]:
+    with self.get_pending_delete_dir() as (batch_dir, leftovers):
+      purged = self.trash_bin.purge(batch_dir, max_size, max_age, keep)
+      # The leftovers were moved into batch_dir as well
+      items = [
+        Path(entry.path) for entry in os.scandir(batch_dir)
+        if entry.name != pending_lock_basename
+      ]
+      delete_items(items, jobs, progress_function)
+    return purged
+
   def get_asset_flag(self, asset: Asset) -> str:
+    # importing on-demand for faster overall import times
+    import pycountry
     ui_info = asset.get_ui_info()
     if not ui_info:
       return
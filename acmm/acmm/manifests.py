@@ -0,0 +1,1003 @@
+# File manifests of the supported extensions. These are rarely needed and
+# large, so they are kept out of the data module and imported on demand.
+manifests = {
+  # Files present in all versions of CSP
+  'csp-common-files': [
+    'dwrite.dll',
+    ( 'extension',
+      [ 'shaders.zip',
+        ( 'config',
+          [ 'brakedisc_fx.ini', 'car_instruments.ini', 'chaser_camera.ini', 'chat_shortcuts.ini',
+            'colorful_shadowing.ini', 'data_alt_mapping.ini', 'data_apps_allowed_to_pause.txt',
+            'data_car_classes.ini', 'data_car_years.ini', 'data_countries.ini', 'data_credits.txt',
+            'data_gbuffer.ini', 'data_human_materials.ini', 'data_manifest.ini',
+            'data_oem_colors_vintage.txt', 'data_standard_content.ini', 'dxgi_tweaks.ini',
+            'extra_fx.ini', 'fake_shadows_fx.ini', 'ffb_tweaks.ini', 'freer_camera.ini',
+            'g27_lights.ini', 'general.ini', 'graphics_adjustments.ini', 'grass_fx.ini', 'gui.ini',
+            'lighting_fx.ini', 'mumble_plugin.ini', 'music.ini', 'neck.ini', 'new_behaviour.ini',
+            'nice_screenshots.ini', 'particles_fx.ini', 'reflections_fx.ini', 'shadowed_wheels.ini',
+            'skidmarks_fx.ini', 'small_tweaks.ini', 'smart_mirror.ini', 'smart_shadows.ini',
+            'splashscreen.ini', 'taskbar.ini', 'track_adjustments.ini', 'triple_custom.ini',
+            'tyres_fx.ini', 'vr_tweaks.ini', 'walking_out.ini', 'weather_fx.ini', 'windscreen_fx.ini',
+            'yebisest.ini',
+            ( 'cars',
+              [ ( 'common',
+                  [ 'custom_emissive.ini', 'custom_rims.ini', 'dev_material_carpaint.ini',
+                    'dev_material_interior.ini', 'f1_generic.ini', 'f1_lights.ini',
+                    'f1_tyre_damage.ini', 'functions_base.lua', 'gt3_exhaust_glow.ini',
+                    'gt3_lights.ini', 'gt3_tyres_kunos.ini', 'human_surface_template.ini',
+                    'materials_base.ini', 'materials_carpaint.ini', 'materials_glass.ini',
+                    'materials_interior.ini', 'materials_license_plate.ini', 'navigators.ini',
+                    'navigators_layouts.ini', 'navigators_maps.ini', 'navigators_mixins.ini',
+                    'navigators_themes.ini', 'no_popup_lights.ini',
+                    'oldschool_lights_reflections.ini', 'selflighting.ini', 'tyre_patterns.ini']),
+                ('generic', ['generic.ini', 'generic_fixes.ini', 'generic_rain_tyres.ini'])]),
+            ( 'tracks',
+              [ ( 'common',
+                  [ 'all_conditions.ini', 'benner900conditions.ini', 'colorfulness.lut',
+                    'colorfulnesspotrero.lut', 'conditions.ini', 'conditions_blm.ini',
+                    'custom_emissive.ini', 'digiclock47_conditions.ini', 'flag_colors.lut',
+                    'functions_base.lua', 'grass_fx.ini', 'materials_base.ini', 'materials_glass.ini',
+                    'materials_track.ini']),
+                ('generic', ['generic.ini'])])]),
+        ( 'lua',
+          [ ( 'chaser-camera',
+              [ ('arcade-mode', ['camera.lua', 'manifest.ini']),
+                ('arcade-mode-2', ['camera.lua', 'manifest.ini']),
+                ('base', ['camera.lua', 'manifest.ini']),
+                ('drone', ['camera.lua', 'manifest.ini'])]),
+            ( 'fireworks',
+              [ ( 'holidays',
+                  [ 'extra_fireworks.bank', 'fireworks.lua', 'fireworks_audio.lua',
+                    'fireworks_base.lua', 'fireworks_colors.lua', 'fireworks_pyro.lua',
+                    'fireworks_schemes.lua', 'fireworks_spawn.lua', 'fireworks_types.lua',
+                    'guids.txt', 'manifest.ini', 'utils.lua',
+                    ( 'schemes',
+                      [ 'christmas.lua', 'debug.lua', 'default.lua', 'independence_day.lua',
+                        'victory_day.lua'])])]),
+            ( 'new-modes',
+              [ ('driver-interview', ['manifest.ini', 'mode.lua', 'stopwatch.png', 'tasks.png']),
+                ('overtake', ['manifest.ini', 'mode.lua'])])]),
+        ( 'textures',
+          [ ( 'color_grading',
+              [ '3-strip alt.png', '3-strip.png', 'autumn.png', 'ava.png', 'bright.png',
+                'cine bright.png', 'cine cold.png', 'cine drama.png', 'cine teal orange 1.png',
+                'cine teal orange 2.png', 'cine vibrant.png', 'cine warm.png', 'coffee.png',
+                'crisp winter.png', 'dark blue.png', 'deep.png', 'dithered.png', 'faded.png',
+                'four.png', 'fuji 2393.png', 'fuji 3510.png', 'kodak.png', 'moody.png',
+                'natural pop.png', 'neutral.png', 'oldschool.png', 'rottenish.png', 'saturated.png',
+                'teigen.png', 'the matrix.png', 'threshold.png', 'tweed.png', 'underpass.png'])]),
+        ( 'weather',
+          [ ( 'base',
+              [ 'manifest.ini', 'weather.lua', ('clouds', ['atlas.dds']),
+                ( 'src',
+                  [ 'conditions_converter.lua', 'consts.lua', 'light_pollution.lua', 'utils.lua',
+                    'weather_application.lua', 'weather_clouds.lua'])])]),
+        ('weather-controllers', [('base', ['controller.lua', 'manifest.ini'])])])
+  ],
+
+  # Files present in all versions of Pure
+  'pure-common-files': [
+    ( 'apps',
+      [ ( 'lua',
+          [ ( 'pureconfig',
+              [ '_license and copyright.txt', 'icon.png', 'manifest.ini', 'pureconfig.lua',
+                ('ui', ['configdesign.lua', 'configinfo.lua'])])])]),
+    ( 'content',
+      [ ('gui', [('icons', ['sol planner_off.png', 'sol planner_on.png'])]),
+        ( 'weather',
+          [ ('sol_00_no_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_01_clear', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_02_few_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_03_scattered_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_04_windy', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_05_broken_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_06_overcast', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_11_mist', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_12_fog', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_21_haze', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_22_dust', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_23_sand', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_24_smoke', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_31_light_drizzle', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_32_drizzle', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_33_heavy_drizzle', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_34_light_rain', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_35_rain', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_36_heavy_rain', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_41_light_thunderstorm', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_42_thunderstorm', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_43_heavy_thunderstorm', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_44_squalls', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_45_tornado', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_46_hurricane', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_51_light_snow', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_52_snow', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_53_heavy_snow', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_54_light_sleet', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_55_sleet', ['preview.jpg', 'weather.ini']),
+            ('sol_56_heavy_sleet', ['preview.jpg', 'weather.ini']),
+            ('sol_57_hail', ['preview.jpg', 'weather.ini'])])]),
+    ( 'extension',
+      [ ( 'config-ext',
+          [ ( 'pure',
+              [ ( 'skydome_sets',
+                  [ ( 'default_16k',
+                      [ 'skydome_script.lua',
+                        ( 'textures',
+                          [ '159534903_mask.dds', '159534903n_mask.dds', '160889919_mask.dds',
+                            '160889920_mask.dds', '161184986_mask.dds', '161568492n_mask.dds',
+                            '162072753_mask.dds', '162700796_mask.dds', '163266525_mask.dds',
+                            '165516231_mask.dds', '171898272_mask.dds', '174645428_mask.dds',
+                            '176525931_mask.dds', '176525936_mask.dds', '178602682_mask.dds',
+                            '178602682n_mask.dds', '179611287_mask.dds', '180258644_mask.dds',
+                            '180258667_mask.dds', '180909074_mask.dds', '180909084_mask.dds',
+                            '181447523_mask.dds', '182453668_mask.dds', '183249460_mask.dds',
+                            '183249480_mask.dds', '188756621_mask.dds', '190692927_mask.dds',
+                            '190760457_mask.dds', '190760457n_mask.dds', '192150758_mask.dds',
+                            '196200727_mask.dds', '196200739_mask.dds', '217529345_mask.dds',
+                            '228834139_mask.dds', '231158888_mask.dds', '233525913_mask.dds',
+                            '235922208_mask.dds', '235922208n_mask.dds', '240377153_mask.dds',
+                            '242498123_mask.dds',
+                            ( 'encrypted',
+                              [ '159534903.dds', '159534903n.dds', '160889919.dds', '160889920.dds',
+                                '161184986.dds', '161568492.dds', '161568492n.dds', '162072753.dds',
+                                '162700796.dds', '163266525.dds', '165516231.dds', '171898272.dds',
+                                '174645428.dds', '176525931.dds', '176525936.dds', '178602682.dds',
+                                '178602682n.dds', '179611287.dds', '180258644.dds', '180258667.dds',
+                                '180909074.dds', '180909084.dds', '181447523.dds', '182453668.dds',
+                                '183249430.dds', '183249460.dds', '183249480.dds', '188756621.dds',
+                                '190692927.dds', '190760457.dds', '190760457n.dds', '192150758.dds',
+                                '196200727.dds', '196200739.dds', '217529345.dds', '228834139.dds',
+                                '231158888.dds', '233525913.dds', '235922208.dds', '235922208n.dds',
+                                '240377153.dds', '242498123.dds'])])])])])]),
+        ( 'weather',
+          [ ( 'pure',
+              [ '_license and copyright.txt', 'manifest.ini', 'pure_ai.lua', 'pure_audio.lua',
+                'pure_camera.lua', 'pure_config.lua', 'pure_globals.lua', 'pure_interface.lua',
+                'pure_planner.lua', 'pure_pp.lua', 'pure_raw.lua', 'pure_render.lua',
+                'pure_script.lua', 'pure_sharing.lua', 'pure_state.lua', 'pure_stellar.lua',
+                'pure_track.lua', 'pure_weather.lua', 'pure_world.lua', 'weather.lua',
+                ('audio', ['guids.txt', 'rain.bank', 'sol.bank', 'wiper.bank']),
+                ('config', ['config_classes.lua']), ('exposure', ['pure_exposure.lua']),
+                ('pp', ['tonemapping.fx', 'tonemapping.lua']),
+                ( 'render',
+                  [ 'render__list.lua',
+                    ( 'landscape',
+                      [ 'noise3d.dds', 'render_landscape.lua_encrypted',
+                        ( 'textures',
+                          [ 'asian-city-farm-dark-forest.dds', 'asian-city-full.dds',
+                            'asian-city-w-forest.dds', 'austr-city-farm1-mixed-forest2.dds',
+                            'austr-city-farm1.dds', 'euro-city-farmgreen-mixed-forest.dds',
+                            'european-city-on-farm-1.dds', 'european-farm-1.dds', 'farm-mixed-2.dds',
+                            'forest-dark-eurofarm-brown-v2.dds', 'forest-decidious-barren-land-1.dds',
+                            'forest-decidious-eurofarm-1-v2.dds', 'forest-mixed-western-barren-2.dds',
+                            'french-farm-sparsecity-1.dds', 'grand-canyon-red-3.dds',
+                            'grand-canyon-red-4.dds', 'grand-canyon-red-5.dds',
+                            'grand-canyon-red-trees.dds', 'mntn-red-desert.dds',
+                            'range-herbacious-bare-ground-2.dds', 'range-herbacious-grass-green.dds',
+                            'range-herbacious-grass-yellow.dds',
+                            'range-herbacious-mixed-wilderness-3.dds', 'source.txt'])]),
+                    ( 'rainhaze',
+                      [ 'noise3d.dds', 'rainhaze_apply.fx', 'rainhaze_base.fx',
+                        'render_rainhaze.lua'])]),
+                ( 'script',
+                  ['default_exposure_handling.lua', 'post_processing.lua', 'script_tools.lua']),
+                ('sdk', ['pure_sdk.lua']), ('space', ['moon.png', 'starmap_8k.dds']),
+                ('track_adaptions', ['track_adaption.ini']),
+                ('ui', ['pure_ui.lua', 'pure_ui__filedialog.lua']),
+                ( 'utils',
+                  [ 'config_ini_parser.lua', 'json_parser.lua', 'utils_basics.lua',
+                    'utils_connect.lua', 'utils_csp_backwards_compatibility.lua', 'utils_dataset.lua',
+                    'utils_json.lua', 'utils_lua.lua', 'utils_lut.lua', 'utils_memory_backup.lua',
+                    'utils_stack.lua', 'utils_state.lua', 'utils_wrongcsp.lua']),
+                ('weather', ['weather_definitions.json', 'weather_definitions.lua']),
+                ( 'world',
+                  [ 'world_ambient_light.lua', 'world_clouds.lua',
+                    'world_directional_ambient_light.lua', 'world_fog.lua', 'world_lights.lua',
+                    'world_moon.lua', 'world_night_light_pollution.lua', 'world_sky.lua',
+                    'world_sun_light.lua',
+                    ( 'clouds',
+                      [ ( '2d',
+                          [ 'class_set.lua', 'class_texture.lua', 'class_weather.lua',
+                            'clouds_main.lua']),
+                        ( '3d',
+                          [ 'cloud_definitions.lua', 'clouds_cirrostratus.lua', 'clouds_classes.lua',
+                            'clouds_cumulus.lua', 'clouds_general_lighting.lua',
+                            'clouds_lightnings.lua', 'clouds_main.lua', 'clouds_shadows.lua',
+                            ( 'textures',
+                              [ 'c1.png', 'c2.dds', 'c2.png', 'c3.dds', 'c3.png', 'c4.dds', 'c4.png',
+                                'c5.png', 'c6.png', 'c_b1.dds', 'c_b1.png', 'debug_honly.png',
+                                'debug_hv.png', 'debug_vonly.png'])])]),
+                    ('lightnings', ['lightnings.lua', 'lightnings_classes.lua'])])])]),
+        ('weather-controllers', [])]),
+    ( 'system',
+      [ ( 'cfg',
+          [ ( 'ppfilters',
+              [ 'pure.ini', 'purecandy.ini', 'purelinear.ini',
+                ( 'pure_scripts',
+                  [ 'default_script.lua', 'pure.lua', 'pure_nopp.lua', 'purecandy.lua',
+                    'purelinear.lua'])])])])
+  ],
+
+  # All files that have ever been in any version of Pure
+  'pure-all-files': [
+    '_license and copyright.txt', 'description.jsgme', 'install_pure.bat', 'uninstall_pure.bat',
+    'uninstall_sol.bat', 'uninstall_sol__install_pure.bat',
+    ( 'apps',
+      [ ( 'lua',
+          [ ( 'pureconfig',
+              [ '_license and copyright.txt', 'icon.png', 'manifest.ini', 'pureconfig.lua',
+                'reset_dummy.lua', 'sync.ffs_db',
+                ('ui', ['configdesign.lua', 'configinfo.lua', 'gl.lua', ('assets', ['strobo.png'])]),
+                ('utils', ['fix_settings.lua', 'groundfog.lua'])]),
+            ( 'pureplanner',
+              [ '_license and copyright.txt', 'ext_app_controls.ini', 'icon.png', 'manifest.ini',
+                'pureplanner.lua', 'reset_dummy.lua', 'sync.ffs_db',
+                ('classes', ['connect_dummy.lua', 'container.lua']),
+                ('connection', ['controller.lua', 'extended_controls.lua', 'states.lua']),
+                ( 'help',
+                  [ 'pure_planner.txt', 'pure_planner_chinese.txt', 'pure_planner_deutsch.txt',
+                    'pure_planner_dutch.txt', 'pure_planner_espania.txt', 'pure_planner_francais.txt',
+                    ( 'editor',
+                      [ 'data_slider_basic.png', 'data_slider_range.png', 'transition_basic.png',
+                        'transition_clear_rain.png', 'weather_selection_cm.png',
+                        'weather_selection_random.png']),
+                    ('live', ['live_control.png']), ('main', []),
+                    ('settings', ['save_button.png'])]),
+                ( 'plan',
+                  [ 'live.lua', 'location.lua', 'plan.lua', 'plan_manager.lua', 'stellar.lua',
+                    'time_handling.lua', 'weather.lua', 'weather_dynamic.lua', 'weather_live.lua']),
+                ('settings', ['settings.lua', 'settings_defaults.lua']),
+                ( 'ui',
+                  [ 'gl.lua', 'plannerdesign.lua', 'tools.lua', 'ui_globals.lua',
+                    ( 'assets',
+                      [ ('control', ['timemulti_backward.png', 'timemulti_forward.png']),
+                        ('controller', ['arrow-0.png', 'arrow-45.png']),
+                        ( 'stellar',
+                          [ 'iss.png', 'mars.png', 'mercury.png', 'moon0.png', 'moon1.png',
+                            'moon2.png', 'moon3.png', 'moon4.png', 'moon5.png', 'moon6.png',
+                            'moon7.png', 'moon8.png', 'moon9.png', 'saturn.png', 'sun.png',
+                            'venus.png']),
+                        ( 'weather',
+                          [ '0.png', '1.png', '10.png', '100.png', '11.png', '12.png', '13.png',
+                            '14.png', '15.png', '16.png', '17.png', '18.png', '19.png', '2.png',
+                            '20.png', '21.png', '22.png', '23.png', '24.png', '25.png', '26.png',
+                            '27.png', '28.png', '3.png', '31.png', '4.png', '40.png', '41.png',
+                            '42.png', '5.png', '50.png', '6.png', '666.png', '7.png', '8.png',
+                            '9.png', 'override.png'])])])]),
+            ( 'purepp',
+              [ '_license and copyright.txt', 'icon.png', 'manifest.ini', 'purepp.lua',
+                'reset_dummy.lua', 'sync.ffs_db', ('ui', ['gl.lua', 'ppdesign.lua']),
+                ('utils', ['fix_settings.lua', 'groundfog.lua'])])]),
+        ( 'python',
+          [ ( 'sol_planner',
+              [ 'sol_planner.ini', 'sol_planner.py',
+                ( 'plans',
+                  [ 'clouds_test.ini', 'cloudy-rainy-nice.ini', 'cm-test.ini', 'empty.ini',
+                    'lemans21test.ini', 'random dry.ini', 'summer-day.ini', 'test4.ini']),
+                ( 'presets',
+                  [ '__backup2.ini', 'backup1.ini', 'bad45.ini', 'checker123weathersuite.ini',
+                    'clear.ini', 'crazy.ini', 'dry.ini', 'empty.ini', 'export.ini', 'exporttest4.ini',
+                    'more presets with unusable settings and many more unrelated stuff.ini',
+                    'one.ini', 'only sun.ini', 'presets.ini', 'test1.ini', 'test123.ini',
+                    'test345.ini', 'two.ini', 'ultranice.ini', 'unpredictable.ini']),
+                ('settings', ['settings.ini', 'settings_defaults.ini']),
+                ( 'sol_lib',
+                  [ 'down.png', 'sol_dialogs.py', 'sol_interface.py', 'sol_stellar.py', 'sol_ui.py',
+                    'up.png']),
+                ('stdlib', ['_ctypes.pyd']), ('stdlib64', ['_ctypes.pyd']),
+                ( 'tex',
+                  [ '0.png', '1.png', '10.png', '100.png', '11.png', '12.png', '13.png', '14.png',
+                    '15.png', '16.png', '17.png', '18.png', '19.png', '2.png', '20.png', '21.png',
+                    '22.png', '23.png', '24.png', '25.png', '26.png', '27.png', '28.png', '3.png',
+                    '31.png', '4.png', '40.png', '41.png', '42.png', '5.png', '50.png', '6.png',
+                    '666.png', '7.png', '8.png', '9.png', 'exportplan.png', 'exportpreset.png',
+                    'fullday.png', 'importplan.png', 'importpreset.png', 'minus.png', 'moon0.png',
+                    'moon1.png', 'moon2.png', 'moon3.png', 'moon4.png', 'moon5.png', 'moon6.png',
+                    'pause.png', 'play.png', 'plus.png', 'repeat.png', 'stamped.png', 'stop.png',
+                    'sun.png', 'time-minus.png', 'time-plus.png', 'timed.png']),
+                ('ui', ['ui_app.json'])])])]),
+    ( 'content',
+      [ ('gui', [('icons', ['sol planner_off.png', 'sol planner_on.png'])]),
+        ( 'weather',
+          [ ('sol_00_no_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_01_clear', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_02_few_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_03_scattered_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_04_windy', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_05_broken_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_06_overcast', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_11_mist', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_12_fog', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_21_haze', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_22_dust', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_23_sand', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_24_smoke', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_31_light_drizzle', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_32_drizzle', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_33_heavy_drizzle', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_34_light_rain', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_35_rain', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_36_heavy_rain', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_41_light_thunderstorm', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_42_thunderstorm', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_43_heavy_thunderstorm', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_44_squalls', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_45_tornado', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_46_hurricane', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_51_light_snow', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_52_snow', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_53_heavy_snow', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_54_light_sleet', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_55_sleet', ['preview.jpg', 'weather.ini']),
+            ('sol_56_heavy_sleet', ['preview.jpg', 'weather.ini']),
+            ('sol_57_hail', ['preview.jpg', 'weather.ini'])])]),
+    ( 'extension',
+      [ ( 'config-ext',
+          [ ( 'pure',
+              [ ('custom_track_adaptions', []),
+                ( 'skydome_sets',
+                  [ ( 'default_16k',
+                      [ 'skydome_script.lua', 'skydome_script_lcs.lua',
+                        ( 'textures',
+                          [ '159534776_mask.dds', '159534903_mask.dds', '159534903n_mask.dds',
+                            '159678489_mask.dds', '159678490_mask.dds', '159678491_mask.dds',
+                            '160889919_mask.dds', '160889920_mask.dds', '161184986_mask.dds',
+                            '161568492_mask.dds', '161568492n_mask.dds', '162072753_mask.dds',
+                            '162700796_mask.dds', '162700797_mask.dds', '163266525.dds',
+                            '163266525_mask.dds', '164102245_mask.dds', '165516231_mask.dds',
+                            '166498827_mask.dds', '166498828_mask.dds', '171898272_mask.dds',
+                            '174645428_mask.dds', '176525931_mask.dds', '176525936_mask.dds',
+                            '178602682_mask.dds', '178602682n_mask.dds', '179611287_mask.dds',
+                            '180258644_mask.dds', '180258667_mask.dds', '180909074_mask.dds',
+                            '180909084_mask.dds', '181447523_mask.dds', '182453668_mask.dds',
+                            '183249430_mask.dds', '183249448_mask.dds', '183249460_mask.dds',
+                            '183249480_mask.dds', '185704534_mask.dds', '187739154_mask.dds',
+                            '188756621_mask.dds', '190692927_mask.dds', '190760432_mask.dds',
+                            '190760457_mask.dds', '190760457n_mask.dds', '192150758_mask.dds',
+                            '196200727_mask.dds', '196200739_mask.dds', '199053995_mask.dds',
+                            '217529345_mask.dds', '228834139_mask.dds', '231158888_mask.dds',
+                            '233525898_mask.dds', '233525913_mask.dds', '235922208_mask.dds',
+                            '235922208n_mask.dds', '240377143_mask.dds', '240377153_mask.dds',
+                            '242498123_mask.dds', '256406606_mask.dds',
+                            'copyright and source information of the.pdf',
+                            'copyright and source information.pdf',
+                            ( 'encrypted',
+                              [ '159534776.dds', '159534903.dds', '159534903n.dds', '159678489.dds',
+                                '159678490.dds', '159678491.dds', '160889919.dds', '160889920.dds',
+                                '161184986.dds', '161568492.dds', '161568492n.dds', '162072753.dds',
+                                '162700796.dds', '162700797.dds', '163266525.dds', '164102245.dds',
+                                '165516231.dds', '166498827.dds', '166498828.dds', '171898272.dds',
+                                '174645428.dds', '176525931.dds', '176525936.dds', '178602682.dds',
+                                '178602682n.dds', '179611287.dds', '180258644.dds', '180258667.dds',
+                                '180909074.dds', '180909084.dds', '181447523.dds', '182453668.dds',
+                                '183249430.dds', '183249448.dds', '183249460.dds', '183249480.dds',
+                                '185704534.dds', '187739154.dds', '188756621.dds', '190692927.dds',
+                                '190760432.dds', '190760457.dds', '190760457n.dds', '192150758.dds',
+                                '196200727.dds', '196200739.dds', '199053995.dds', '217529345.dds',
+                                '228834139.dds', '231158888.dds', '233525898.dds', '233525913.dds',
+                                '235922208.dds', '235922208n.dds', '240377143.dds', '240377153.dds',
+                                '242498123.dds', '256406606.dds',
+                                'copyright and source information of the.pdf',
+                                'copyright and source information.pdf'])])])])]),
+            ( 'pureplanner',
+              [('plans', [('daycycle', []), ('stamp', []), ('timed', [])]), ('weatherpresets', [])]),
+            ('pureshaders', [])]),
+        ( 'lua',
+          [ ( 'pp-filters',
+              [('pure', ['filter.lua', 'manifest.ini', 'reset_dummy.lua', 'sync.ffs_db'])])]),
+        ( 'weather',
+          [ ( 'pure',
+              [ '_license and copyright.txt', 'manifest.ini', 'pure lcs.code-workspace',
+                'pure_ai.lua', 'pure_audio.lua', 'pure_camera.lua', 'pure_config.lua',
+                'pure_globals.lua', 'pure_interface.lua', 'pure_planner.lua', 'pure_pp.lua',
+                'pure_ppstate.lua', 'pure_raw.lua', 'pure_render.lua', 'pure_script.lua',
+                'pure_sharing.lua', 'pure_state.lua', 'pure_stellar.lua', 'pure_track.lua',
+                'pure_weather.lua', 'pure_world.lua', 'reset_dummy.lua', 'settings.ini',
+                'sync.ffs_db', 'weather.lua',
+                ( 'audio',
+                  [ '__sol.bank', 'csp_base_audio.lua', 'guids.txt', 'rain.bank', 'sol.bank',
+                    'wiper.bank']),
+                ('config', ['config_classes.lua']), ('exposure', ['pure_exposure.lua']),
+                ( 'pp',
+                  [ 'blur_prepare.fx', 'custom_filters.lua', 'custompp.fx', 'postprocessing.hlsl',
+                    'postprocessing.lua', 'tonemapping.fx', 'tonemapping.lua',
+                    ( 'yebis',
+                      [ 'pp_blur_prepare.fx', 'pp_dof.fx', 'pp_final.fx', 'pp_gamma.fx',
+                        'pp_tonemapping.hlsl'])]),
+                ('ppf_scripts', []),
+                ( 'render',
+                  [ 'render__list.lua',
+                    ( 'groundfog',
+                      [ 'groundfog_area.fx', 'groundfog_spline.fx', 'noise3d.dds',
+                        'render_groundfog.lua', 'settings_groundfog_eco.lua', 'smoke3d - source.txt',
+                        'smoke3d.dds']),
+                    ( 'landscape',
+                      [ 'noise3d.dds', 'render_landscape.lua_encrypted',
+                        ( 'backup',
+                          [ 'landscape.fx', 'noise3d.dds', 'render_landscape.lua',
+                            'render_landscape.lua_encrypted']),
+                        ( 'textures',
+                          [ 'asian-city-farm-dark-forest.dds', 'asian-city-full.dds',
+                            'asian-city-w-forest.dds', 'austr-city-farm1-mixed-forest2.dds',
+                            'austr-city-farm1.dds', 'euro-city-farmgreen-mixed-forest.dds',
+                            'european-city-on-farm-1.dds', 'european-farm-1.dds', 'farm-mixed-2.dds',
+                            'forest-dark-eurofarm-brown-v2.dds', 'forest-decidious-barren-land-1.dds',
+                            'forest-decidious-eurofarm-1-v2.dds', 'forest-mixed-western-barren-2.dds',
+                            'french-farm-sparsecity-1.dds', 'grand-canyon-red-3.dds',
+                            'grand-canyon-red-4.dds', 'grand-canyon-red-5.dds',
+                            'grand-canyon-red-trees.dds', 'mntn-red-desert.dds',
+                            'range-herbacious-bare-ground-2.dds', 'range-herbacious-grass-green.dds',
+                            'range-herbacious-grass-yellow.dds',
+                            'range-herbacious-mixed-wilderness-3.dds', 'source.txt',
+                            'water-ocean.dds'])]),
+                    ( 'lightning',
+                      [ 'hdr.fx', 'lightning.fx', 'noise3d.dds', 'render_lightning.lua',
+                        'settings_lightning_eco.lua', 'testpic.png']),
+                    ( 'rainhaze',
+                      [ 'noise3d.dds', 'rainhaze_apply.fx', 'rainhaze_base.fx',
+                        'render_rainhaze.lua']),
+                    ( 'sunblinding',
+                      [ 'blur.fx', 'blur_fine.fx', 'blurrgba.fx', 'burn.fx', 'depth_check.fx',
+                        'hdr.fx', 'mask.fx', 'merge.fx', 'mergergba.fx', 'noise3d.dds',
+                        'render_sunblinding.lua', 'settings_sunblinding_eco.lua'])]),
+                ( 'script',
+                  ['default_exposure_handling.lua', 'post_processing.lua', 'script_tools.lua']),
+                ('sdk', ['pure sdk - import this in your workspace.lua', 'pure_sdk.lua']),
+                ('server', ['pureplanneronlineconverter.lua']),
+                ('space', ['moon.dds', 'moon.png', 'starmap_8k.dds']),
+                ( 'spice',
+                  [ 'gl.lua', 'spice.lua',
+                    ( 'spice_hdr_effects',
+                      [ 'calibration.hlsl', 'colorgrading.hlsl', 'magicbloom.hlsl', 'magicbloom.lua',
+                        'sensornoise.hlsl', 'shadertools.hlsl', 'speedtunnel.hlsl', 'speedtunnel.lua',
+                        'spice_hdr.fx', ('colorgrading', ['neutral.png'])]),
+                    ( 'spice_ldr_effects',
+                      [ 'blacklevel.png', 'calibration.hlsl', 'curvedscreen.fx', 'curvedscreen.hlsl',
+                        'curvedscreen.lua', 'curvedscreen.png', 'filter.lua', 'overlay.hlsl',
+                        'overlay.lua', 'shadertools.hlsl', 'spice_ldr.fx', 'testoverlay.png',
+                        'whitelevel.png'])]),
+                ('textures', ['horizont.png', 'overcast.png', 'skydome_dummy.dds']),
+                ( 'track_adaptions',
+                  [ 'track_adaption.ini',
+                    ( 'groundfog',
+                      [ 'groundfog___ks_red_bull_ring_layout_gp.json',
+                        'groundfog_fonteny_fonteny.json',
+                        'groundfog_ks_ad_scottish_highlands_layout_int.json',
+                        'groundfog_ks_brands_hatch_gp.json', 'groundfog_ks_brands_hatch_indy.json',
+                        'groundfog_ks_highlands_layout_drift.json',
+                        'groundfog_ks_highlands_layout_int.json',
+                        'groundfog_ks_highlands_layout_int_traf_left.json',
+                        'groundfog_ks_highlands_layout_int_traf_right.json',
+                        'groundfog_ks_highlands_layout_long.json', 'groundfog_ks_laguna_seca_.json',
+                        'groundfog_ks_nordschleife_endurance.json',
+                        'groundfog_ks_nordschleife_nordschleife.json',
+                        'groundfog_ks_red_bull_ring_layout_gp.json', 'groundfog_monza_.json',
+                        'groundfog_mugello_.json', 'groundfog_spa_.json', 'groundfog_spa_2022.json',
+                        'groundfog_tajo_abtraffic.json', 'groundfog_tmp.json',
+                        'groundfog_union_island_scenic.json', 'groundfog_union_island_traffic.json',
+                        'groundfog_union_island_west.json', 'groundfog_vir_full course.json'])]),
+                ('ui', ['pure_ui.lua', 'pure_ui__filedialog.lua', 'pure_ui_help.lua']),
+                ( 'utils',
+                  [ 'config_ini_parser.lua', 'json_parser.lua', 'utils_basics.lua',
+                    'utils_connect.lua', 'utils_cpu.lua', 'utils_csp_backwards_compatibility.lua',
+                    'utils_dataset.lua', 'utils_import.json', 'utils_import.lua', 'utils_json.lua',
+                    'utils_lua.lua', 'utils_lut.lua', 'utils_memory_backup.lua',
+                    'utils_smoothing.lua', 'utils_stack.lua', 'utils_state.lua',
+                    'utils_wrongcsp.lua']),
+                ('weather', ['weather_definitions.json', 'weather_definitions.lua']),
+                ( 'world',
+                  [ 'world_ambient_light.lua', 'world_clouds.lua',
+                    'world_directional_ambient_light.lua', 'world_fog.lua',
+                    'world_fog__gamma_fix.lua', 'world_lights.lua', 'world_moon.lua',
+                    'world_night_light_pollution.lua', 'world_sky.lua', 'world_sun_light.lua',
+                    ( 'clouds',
+                      [ ( '2d',
+                          [ 'bottom.fx', 'class_set.lua', 'class_texture.lua', 'class_weather.lua',
+                            'clouds_main.lua']),
+                        ( '3d',
+                          [ 'cloud_definitions.lua', 'clouds_cirrostratus.lua', 'clouds_classes.lua',
+                            'clouds_cumulus.lua', 'clouds_general_lighting.lua',
+                            'clouds_lightnings.lua', 'clouds_main.lua', 'clouds_shadows.lua',
+                            ( 'textures',
+                              [ 'c1.png', 'c2.dds', 'c2.png', 'c3.dds', 'c3.png', 'c4.dds', 'c4.png',
+                                'c5.png', 'c6.png', 'c_b1.dds', 'c_b1.png', 'debug_honly.png',
+                                'debug_hv.png', 'debug_vonly.png'])])]),
+                    ('fog_classes', ['pure_fog_classes.lua']),
+                    ('lightnings', ['lightnings.lua', 'lightnings_classes.lua'])])]),
+            ( 'pure lcs',
+              [ '_license and copyright.txt', 'forced_settings.ini', 'manifest.ini', 'moon.dds',
+                'moon_enc.dds', 'moon_end.dds', 'reset_dummy.lua', 'settings.ini', 'spice233.zip',
+                'sync.ffs_db', 'weather.lua', ('.vscode', ['settings.json']),
+                ('clouds', ['atlas.dds', 'iw_d26.dds', 'noise3d.dds']),
+                ('ppf_scripts', ['default_script.lua', 'pure_nopp.lua']),
+                ( 'pure',
+                  [ 'pure_ai.lua', 'pure_audio.lua', 'pure_camera.lua', 'pure_exposure.lua',
+                    'pure_globals.lua', 'pure_header.lua', 'pure_pp.lua', 'pure_ppstate.lua',
+                    'pure_render.lua', 'pure_script.lua', 'pure_sharing.lua', 'pure_state.lua',
+                    'pure_track.lua', 'pure_update.lua', ('audio', ['csp_base_audio.lua']),
+                    ( 'config',
+                      [ 'config_classes.lua', 'pure_config.lua', 'pure_config_root.lua',
+                        'pure_config_tools.lua']),
+                    ('osd', ['osd_class.lua', 'pureosds.lua']),
+                    ( 'pp',
+                      [ 'custom_filters.lua', 'postprocessing.lua', 'tonemapping.fx',
+                        'tonemapping.lua', 'tonemapping_lightpp.fx']),
+                    ( 'render',
+                      [ 'render__list.lua',
+                        ( 'groundfog',
+                          [ 'groundfog_area.fx', 'groundfog_headlights.fx', 'groundfog_spline.fx',
+                            'highbeams.dds', 'noise3d.dds', 'render_groundfog.lua',
+                            'settings_groundfog_eco.lua', 'smoke3d - source.txt', 'smoke3d.dds']),
+                        ('landscape', ['landscape_quad.fx', 'render_landscape.lua']),
+                        ( 'lightning',
+                          [ 'hdr.fx', 'lightning.fx', 'noise3d.dds', 'render_lightning.lua',
+                            'settings_lightning_eco.lua', 'testpic.png']),
+                        ( 'mountains',
+                          [ 'cloud.fx', 'noise3d.dds', 'render_mountains.lua', 'test8.dds',
+                            'worley7.dds']),
+                        ( 'rainhaze',
+                          [ 'noise3d.dds', 'rainhaze_apply.fx', 'rainhaze_base.fx',
+                            'render_rainhaze.lua']),
+                        ('sunblinding', ['render_sunblinding.lua', 'settings_sunblinding_eco.lua'])]),
+                    ( 'script',
+                      ['default_exposure_handling.lua', 'post_processing.lua', 'script_tools.lua']),
+                    ('sdk', ['pure sdk - import this in your workspace.lua', 'pure_sdk.lua']),
+                    ('space', ['moon.dds', 'starmap_8k.dds']),
+                    ( 'utils',
+                      [ 'config_ini_parser.lua', 'gl.lua', 'json_parser.lua', 'utils_basics.lua',
+                        'utils_connect.lua', 'utils_cpu.lua', 'utils_header.lua', 'utils_import.json',
+                        'utils_json.lua', 'utils_lut.lua', 'utils_memory_backup.lua',
+                        'utils_smoothing.lua', 'utils_state.lua', 'utils_wrongcsp.lua']),
+                    ( 'world',
+                      [ 'world_clouds.lua',
+                        ( 'clouds',
+                          [ ( '2d',
+                              [ 'bottom.fx', 'class_set.lua', 'class_texture.lua',
+                                'class_weather.lua', 'clouds_main.lua',
+                                ('textures', ['skydome_dummy.dds'])]),
+                            ( '3d',
+                              [ 'clouds_classes.lua', 'clouds_main.lua', 'clouds_shadows.lua',
+                                ('textures', ['c2.dds', 'c_b1.dds'])]),
+                            ( 'skydomes',
+                              [ 'cloud_shadows.fx', 'clouds__skydomes.lua',
+                                'clouds__skydomes_shadows.lua', 'test.png'])]),
+                        ('lightnings', ['lightnings.lua', 'lightnings_classes.lua'])])]),
+                ( 'shaders',
+                  [ 'aurora_apply.fx', 'aurora_base.hlsl', 'aurora_blur.fx', 'aurora_blur_high.fx',
+                    'aurora_shape.fx', 'aurora_shape_high.fx', 'cloud_shadows_test.fx', 'clouds.fx',
+                    'fog.fx', 'lightning.fx', 'pp_ae_1.fx', 'pp_ae_pure_prepare.fx',
+                    'pp_bloom_downsample.fx', 'pp_bloom_quality1.fx', 'pp_bloom_threshold.fx',
+                    'pp_bloom_upsample.fx', 'pp_blur_prepare copy.fx', 'pp_blur_prepare.fx',
+                    'pp_dof.fx', 'pp_final.fx', 'pp_gamma.fx', 'pp_tonemapping.hlsl',
+                    'rainhaze_apply.fx', 'rainhaze_base.fx', 'showroom_cubemap.fx', 'surface.fx',
+                    'test.fx', 'tonemapping_test.fx']),
+                ( 'spice',
+                  [ 'gl.lua', 'spice.lua',
+                    ( 'spice_hdr_effects',
+                      [ 'calibration.hlsl', 'colorgrading.hlsl', 'magicbloom.hlsl', 'magicbloom.lua',
+                        'sensornoise.hlsl', 'shadertools.hlsl', 'speedtunnel.hlsl', 'speedtunnel.lua',
+                        'spice_hdr.fx', ('colorgrading', ['neutral.png'])]),
+                    ( 'spice_ldr_effects',
+                      [ 'blacklevel.png', 'calibration.hlsl', 'curvedscreen.fx', 'curvedscreen.hlsl',
+                        'curvedscreen.lua', 'curvedscreen.png', 'filter.lua', 'overlay.hlsl',
+                        'overlay.lua', 'shadertools.hlsl', 'spice_ldr.fx', 'testoverlay.png',
+                        'whitelevel.png'])]),
+                ( 'src',
+                  [ 'audio.lua', 'conditions_converter.lua', 'consts.lua', 'light_pollution.lua',
+                    'render.lua', 'render_aurora.lua', 'render_clouds.lua', 'render_eclipse.lua',
+                    'render_fog.lua', 'render_lightning.lua', 'render_linear.lua',
+                    'render_meteor.lua', 'render_postprocessing.lua', 'render_rain.lua',
+                    'render_surface.lua', 'render_test.lua', 'showroom_mode.lua', 'tests.lua',
+                    'utils.lua', 'weather_application.lua', 'weather_clouds.lua',
+                    'weather_clouds_pertrack.lua', 'weather_clouds_types.lua'])])]),
+        ( 'weather-controllers',
+          [ ( 'purectrl',
+              [ 'cm-drive.lua', 'controller.lua', 'manifest.ini', 'settings.ini', 'sync.ffs_db',
+                'weather_params.lua', ('.vscode', ['settings.json'])]),
+            ('purectrl static', ['controller.lua', 'manifest.ini', 'sync.ffs_db']),
+            ( 'sol2',
+              [ 'cm-drive.lua', 'controller.lua', 'manifest.ini', 'reset_dummy.lua', 'settings.ini',
+                'sol__interface.lua', 'sol__shared_memory__backup.lua', 'tools.lua', 'utils_lut.lua',
+                'weather_params.lua']),
+            ('sol2static', ['controller.lua', 'manifest.ini'])])]),
+    ( 'system',
+      [ ( 'cfg',
+          [ ( 'ppfilters',
+              [ 'pure.ini', 'purecandy.ini', 'purehdr-eye.ini', 'purehdr.ini', 'purelinear.ini',
+                'puresimple.ini', 'purevr.ini', 'sync.ffs_db',
+                ( 'pure_scripts',
+                  [ 'default_script.lua', 'pure.lua', 'pure_nopp.lua', 'purecandy.lua',
+                    'purehdr-eye.lua', 'purehdr.lua', 'purelinear.lua', 'purevr.lua', 'sync.ffs_db',
+                    ('pure_ui', ['pure.ui', 'purebg.png', 'purelogo.png'])]),
+                ( 'purelcs_scripts',
+                  [ 'pure.lua', 'purecandy.lua', 'purehdr.lua', 'purelinear.lua', 'purevr.lua',
+                    ('pure', ['purelcs_hdr.lua', 'purelcs_screen.lua', 'purelcs_vr.lua']),
+                    ('pure_ui', ['pure.ui', 'purebg.png', 'purelogo.png'])])])])])
+  ],
+
+  # Files present in all versions of SOL
+  'sol-common-files': [
+    ( 'apps',
+      [ ( 'python',
+          [ ( 'sol_config',
+              [ 'sol_config.py', ('settings', ['settings_defaults.ini']), ('stdlib', ['_ctypes.pyd']),
+                ('stdlib64', ['_ctypes.pyd']), ('ui', ['ui_app.json'])]),
+            ( 'sol_weather',
+              [ 'sol_weather.py', ('extlibs', ['win32con.py']),
+                ('settings', ['settings_defaults.ini']), ('stdlib', ['_ctypes.pyd']),
+                ('stdlib64', ['_ctypes.pyd']), ('ui', ['ui_app.json'])])])]),
+    ( 'content',
+      [ ( 'gui',
+          [ ( 'icons',
+              [ 'sol config_off.png', 'sol config_on.png', 'sol plan selector_off.png',
+                'sol plan selector_on.png', 'sol weather_off.png', 'sol weather_on.png'])]),
+        ( 'weather',
+          [ ('sol_00_no_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_01_clear', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_02_few_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_03_scattered_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_04_windy', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_05_broken_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_06_overcast', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_11_mist', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_12_fog', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_21_haze', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_22_dust', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_23_sand', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_24_smoke', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_31_light_drizzle', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_32_drizzle', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_33_heavy_drizzle', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_34_light_rain', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_35_rain', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_36_heavy_rain', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_41_light_thunderstorm', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_42_thunderstorm', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_43_heavy_thunderstorm', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_44_squalls', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_45_tornado', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_46_hurricane', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_51_light_snow', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_52_snow', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_53_heavy_snow', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_54_light_sleet', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ('sol_55_sleet', ['preview.jpg', 'weather.ini']),
+            ('sol_56_heavy_sleet', ['preview.jpg', 'weather.ini']),
+            ('sol_57_hail', ['preview.jpg', 'weather.ini'])])]),
+    ( 'extension',
+      [ ( 'weather',
+          [ ('simpleppoff', ['weather.lua']),
+            ( 'sol',
+              [ 'manifest.ini', 'reset_dummy.lua', 'sol__audio.lua', 'sol__basics.lua',
+                'sol__check_config.lua', 'sol__config.lua', 'sol__filter.lua', 'sol__ini_parser.lua',
+                'sol__ll_info.lua', 'sol__sequenzer.lua', 'sol__solar_system.lua', 'sol__weather.lua',
+                'sol__weather_definitions.lua', 'sol__weather_effects.lua', 'weather.lua',
+                ('audio', ['guids.txt', 'sol.bank']),
+                ( 'clouds',
+                  [ 'sol_skysim.lua', 'sol_skysim__cirrostratus.lua', 'sol_skysim__distanthaze.lua',
+                    'sol_skysim__lightning.lua', 'sol_skysim__stratus.lua',
+                    'sol_skysim__template.lua', 'sol_skysim_clouds.lua', 'sol_skysim_utils.lua',
+                    ( '2d',
+                      [ ( 'far',
+                          [ 'far01.dds', 'far02.dds', 'far03.dds', 'far04.dds', 'far05.dds',
+                            'far06.dds', 'far07.dds', 'far08.dds', 'far09.dds', 'far10.dds',
+                            'far11.dds', 'far12.dds', 'far13.dds', 'far14.dds', 'far15.dds']),
+                        ('hazy', ['hazy1.dds'])]),
+                    ( '3d',
+                      [ 'cirrostratus.png', 'cumulus.png', 'debug.png', 'lightning.png',
+                        'stratus.png']),
+                    ( 'info',
+                      [ '..dds', '0.dds', '1.dds', '2.dds', '3.dds', '4.dds', '5.dds', '6.dds',
+                        '7.dds', '8.dds', '9.dds', 'csp_update_to.dds', 'is_needed.dds'])]),
+                ('space', ['moon.png', 'starmap_4k.dds', 'starmap_8k.dds'])])]),
+        ( 'weather-controllers',
+          [ ( 'sol',
+              [ 'controller.lua', 'manifest.ini', 'sol__weather_changer.lua', 'sol__weather_plan.lua',
+                ( 'weather_plans',
+                  [ '__test.lua', 'clear_to_rain.lua', 'd_dynamic_complex.lua',
+                    'd_dynamic_complex_faster.lua', 'd_random_10mins.lua', 'd_random_1hour.lua',
+                    'd_random_30mins.lua', 'd_random_complex.lua', 'd_random_complex_faster.lua',
+                    'damgams_randomized.lua', 'demo.lua', 'extemetest.lua', 'laguna.lua',
+                    'lemans.lua', 'raintest.lua', 'random.lua', 'sol_random_1hour.lua', 'storm.lua',
+                    'transition_test.lua', 'unpredictable.lua', 'watertest.lua'])])])]),
+    ( 'system',
+      [ ( 'cfg',
+          [ ( 'ppfilters',
+              [ '__sol.ini', '__sol_extra.ini', 'custom config example.ini',
+                ('sol_custom_configs', ['__sol.lua', '__sol_basic_cc.lua', '__sol_extra.lua'])])])])
+  ],
+
+  # All files that have ever been in any version of SOL
+  'sol-all-files': [
+    'description.jsgme', 'soluninstall.bat',
+    ( 'apps',
+      [ ( 'python',
+          [ ( 'sol_config',
+              [ 'sol_config.ini', 'sol_config.py', ('settings', ['settings_defaults.ini']),
+                ( 'sol_lib',
+                  [ 'down.png', 'sol_dialogs.py', 'sol_interface.py', 'sol_stellar.py', 'sol_ui.py',
+                    'up.png']),
+                ('stdlib', ['_ctypes.pyd']), ('stdlib64', ['_ctypes.pyd']),
+                ('ui', ['ui_app.json'])]),
+            ( 'sol_custom_weather',
+              [ 'sol_custom_weather.ini', 'sol_custom_weather.py',
+                ('settings', ['settings_defaults.ini']),
+                ( 'sol_lib',
+                  [ 'down.png', 'sol_dialogs.py', 'sol_interface.py', 'sol_stellar.py', 'sol_ui.py',
+                    'up.png']),
+                ('stdlib', ['_ctypes.pyd']), ('stdlib64', ['_ctypes.pyd']),
+                ('ui', ['ui_app.json'])]),
+            ( 'sol_planner',
+              [ 'sol_planner.ini', 'sol_planner.py',
+                ( 'plans',
+                  [ 'clouds_test.ini', 'cloudy-rainy-nice.ini', 'cm-test.ini', 'empty.ini',
+                    'lemans21test.ini', 'random dry.ini', 'summer-day.ini', 'test01.ini', 'test4.ini',
+                    'testwasser.ini']),
+                ( 'presets',
+                  [ '__backup2.ini', 'backup1.ini', 'bad45.ini', 'checker123weathersuite.ini',
+                    'clear.ini', 'crazy.ini', 'dry.ini', 'empty.ini', 'export.ini', 'exporttest4.ini',
+                    'more presets with unusable settings and many more unrelated stuff.ini',
+                    'one.ini', 'only sun.ini', 'presets.ini', 'test1.ini', 'test123.ini',
+                    'test345.ini', 'two.ini', 'ultranice.ini', 'unpredictable.ini']),
+                ('settings', ['settings.ini', 'settings_defaults.ini']),
+                ( 'sol_lib',
+                  [ 'down.png', 'sol_dialogs.py', 'sol_interface.py', 'sol_stellar.py', 'sol_ui.py',
+                    'up.png']),
+                ('stdlib', ['_ctypes.pyd']), ('stdlib64', ['_ctypes.pyd']),
+                ( 'tex',
+                  [ '0.png', '1.png', '10.png', '100.png', '11.png', '12.png', '13.png', '14.png',
+                    '15.png', '16.png', '17.png', '18.png', '19.png', '2.png', '20.png', '21.png',
+                    '22.png', '23.png', '24.png', '25.png', '26.png', '27.png', '28.png', '3.png',
+                    '31.png', '4.png', '40.png', '41.png', '42.png', '5.png', '50.png', '6.png',
+                    '666.png', '7.png', '8.png', '9.png', 'exportplan.png', 'exportpreset.png',
+                    'fullday.png', 'importplan.png', 'importpreset.png', 'minus.png', 'moon0.png',
+                    'moon1.png', 'moon2.png', 'moon3.png', 'moon4.png', 'moon5.png', 'moon6.png',
+                    'pause.png', 'play.png', 'plus.png', 'repeat.png', 'stamped.png', 'stop.png',
+                    'sun.png', 'time-minus.png', 'time-plus.png', 'timed.png']),
+                ('ui', ['ui_app.json'])]),
+            ( 'sol_weather',
+              [ 'sol_weather.py', 'template_carconfig.txt', 'template_trackconfig.txt',
+                ('acinfolib', ['acsiminfo.py', 'acsiminfo.py.bak']), ('extlibs', ['win32con.py']),
+                ('settings', ['settings.ini', 'settings_defaults.ini']),
+                ('sim_info_lib', ['sim_info.py']), ('stdlib', ['_ctypes.pyd']),
+                ('stdlib64', ['_ctypes.pyd']), ('ui', ['ui_app.json'])])])]),
+    ( 'content',
+      [ ( 'gui',
+          [ ( 'icons',
+              [ 'sol config_off.png', 'sol config_on.png', 'sol custom weather_off.png',
+                'sol custom weather_off_alt.png', 'sol custom weather_on.png',
+                'sol custom weather_on_alt.png', 'sol plan selector_off.png',
+                'sol plan selector_on.png', 'sol planner_off.png', 'sol planner_on.png',
+                'sol weather_off.png', 'sol weather_on.png'])]),
+        ( 'weather',
+          [ ('1_heavy_fog', ['preview.jpg']), ('2_light_fog', ['preview.jpg']),
+            ('3_clear', ['preview.jpg']), ('4_mid_clear', ['preview.jpg']),
+            ('5_light_clouds', ['preview.jpg']), ('6_mid_clouds', ['preview.jpg']),
+            ('7_heavy_clouds', ['preview.jpg']),
+            ('sol_00_no_clouds', ['colorcurves.ini', 'preview.jpg', 'weather.ini']),
+            ( 'sol_01_clear',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_02_few_clouds',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_03_scattered_clouds',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_04_windy',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_05_broken_clouds',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_06_overcast',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_11_mist',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_12_fog',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_21_haze',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_22_dust',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_23_sand',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_24_smoke',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_31_light_drizzle',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_32_drizzle',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_33_heavy_drizzle',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_34_light_rain',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_35_rain',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_36_heavy_rain',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_41_light_thunderstorm',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_42_thunderstorm',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_43_heavy_thunderstorm',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_44_squalls',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_45_tornado',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_46_hurricane',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_51_light_snow',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_52_snow',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_53_heavy_snow',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_54_light_sleet',
+              [ 'colorcurves.ini', 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua',
+                'tyre_smoke_grass.lua', 'weather.ini']),
+            ( 'sol_55_sleet',
+              [ 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua', 'tyre_smoke_grass.lua',
+                'weather.ini']),
+            ( 'sol_56_heavy_sleet',
+              [ 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua', 'tyre_smoke_grass.lua',
+                'weather.ini']),
+            ( 'sol_57_hail',
+              [ 'preview.jpg', 'tyre_pieces_grass.lua', 'tyre_smoke.lua', 'tyre_smoke_grass.lua',
+                'weather.ini'])])]),
+    ( 'extension',
+      [ ('textures', [('color_grading', ['__sol_extra.png'])]),
+        ( 'weather',
+          [ ('simpleppoff', ['weather.lua']),
+            ( 'sol',
+              [ '__win7__documentsfolderfix.lua', 'manifest.ini', 'reset_dummy.lua', 'sol__audio.lua',
+                'sol__basic_plans.lua', 'sol__basics.lua', 'sol__check_config.lua', 'sol__config.lua',
+                'sol__config__backward_compatibility.lua', 'sol__custom_config.lua',
+                'sol__custom_weather.lua', 'sol__filter.lua', 'sol__ini_parser.lua',
+                'sol__interface.lua', 'sol__ll_info.lua', 'sol__lut.lua', 'sol__sequenzer.lua',
+                'sol__shared_memory__backup.lua', 'sol__solar_system.lua', 'sol__track_adaptions.lua',
+                'sol__weather.lua', 'sol__weather_definitions.lua', 'sol__weather_effects.lua',
+                'weather.lua',
+                ('audio', ['guids - kopie.txt', 'guids.txt', 'rain.bank', 'sol.bank', 'wiper.bank']),
+                ( 'clouds',
+                  [ 'sol__cloud_storage.lua', 'sol_skysim.lua', 'sol_skysim__cirrostratus.lua',
+                    'sol_skysim__cumulus.lua', 'sol_skysim__cumulushumilis.lua',
+                    'sol_skysim__cumulusmediocris.lua', 'sol_skysim__distantcloudy.lua',
+                    'sol_skysim__distanthaze.lua', 'sol_skysim__lightning.lua',
+                    'sol_skysim__stratus.lua', 'sol_skysim__template.lua', 'sol_skysim_clouds.lua',
+                    'sol_skysim_clouds_lighting.lua', 'sol_skysim_dome.lua', 'sol_skysim_utils.lua',
+                    ( '2d',
+                      [ 'noise.dds', 'sol__2d_clouds.lua', 'sol__cloud_db.lua',
+                        ('ceiling', ['c2.dds', 'c2_eco.dds']),
+                        ( 'far',
+                          [ 'far01.dds', 'far02.dds', 'far03.dds', 'far04.dds', 'far05.dds',
+                            'far06.dds', 'far07.dds', 'far08.dds', 'far09.dds', 'far10.dds',
+                            'far11.dds', 'far12.dds', 'far13.dds', 'far14.dds', 'far15.dds']),
+                        ('hazy', ['hazy1.dds']), ('horizon', ['h1.dds', 'h21.dds', 'h31.dds']),
+                        ( 'info',
+                          [ '..dds', '0.dds', '1.dds', '2.dds', '3.dds', '4.dds', '5.dds', '6.dds',
+                            '7.dds', '8.dds', '9.dds', 'csp_update_to.dds', 'is_needed.dds']),
+                        ( 'near',
+                          [ 'n1.dds', 'n2.dds', 'n3.dds', 'n4.dds', 'n7.dds', 'n71.dds', 'n72.dds',
+                            'n73.dds', 'n81.dds']),
+                        ( 'single',
+                          [ '011.dds', '021.dds', '031.dds', '041.dds', '051.dds', '061.dds',
+                            '071.dds']),
+                        ( 'strato',
+                          [ 's1.dds', 's1_eco.dds', 's2.dds', 's2_eco.dds', 's3.dds', 's3_eco.dds',
+                            's5.dds', 's5_eco.dds'])]),
+                    ( '3d',
+                      [ 'cirrostratus.png', 'cumulus.png', 'debug.png', 'lightning.png',
+                        'stratus.png',
+                        ('pattern', ['cumulusmediocris_pattern.lua', 'stratus_pattern.lua'])]),
+                    ( '3d_basemod',
+                      [ 'consts.lua', 'weather_application.lua', 'weather_clouds.lua',
+                        ( 'clouds',
+                          [ 'b0.png', 'b1.png', 'b2.png', 'b3.png', 'b4.png', 'b5.png', 'b6.png',
+                            'b7.png', 'd0.png', 'd1.png', 'd2.png', 'd3.png', 'd4.png', 'f0.png',
+                            'f1.png', 'f2.png', 'h0.png', 'h1.png', 'h2.png', 'h3.png', 's0.png'])]),
+                    ( 'info',
+                      [ '..dds', '0.dds', '1.dds', '2.dds', '3.dds', '4.dds', '5.dds', '6.dds',
+                        '7.dds', '8.dds', '9.dds', 'csp_update_to.dds', 'is_needed.dds'])]),
+                ( 'config',
+                  [ 'sol_config__presets.lua', 'sol_config_design.txt', 'sol_config_manager.lua',
+                    'transition.lua']),
+                ( 'custom weather',
+                  [ 'sol__custom_weather.lua', 'sol__custom_weather__interface.lua',
+                    'sol_custom_weather_design.txt']),
+                ( 'gfx',
+                  [ 'sol__gfx_ambient.lua', 'sol__gfx_direct_ambi.lua', 'sol__gfx_fog.lua',
+                    'sol__gfx_pollution.lua', 'sol__gfx_sun.lua', 'sol__gfx_tools.lua']),
+                ('space', ['moon.png', 'starmap_4k.dds', 'starmap_8k.dds']),
+                ('track adaptions', ['sol__track_adaptions.lua', 'track_adaption.ini'])]),
+            ( 'sol 1.5',
+              [ 'manifest.ini', 'reset_dummy.lua', 'sol__basic_plans.lua', 'sol__basics.lua',
+                'sol__check_config.lua', 'sol__cloud_db.lua', 'sol__clouds.lua', 'sol__config.lua',
+                'sol__custom_weather.lua', 'sol__filter.lua', 'sol__ini_parser.lua',
+                'sol__ll_info.lua', 'sol__sequenzer.lua', 'sol__solar_system.lua',
+                'sol__track_adaptions.lua', 'sol__weather.lua', 'sol__weather_definitions.lua',
+                'sol__weather_effects.lua', 'weather.lua',
+                ( '3dclouds',
+                  [ 'consts.lua', 'utils.lua', 'weather_application.lua', 'weather_clouds.lua',
+                    ( 'clouds',
+                      [ 'atlas.dds', 'atlas.png', 'atlas_debug.dds', 'b0.png', 'b1.png', 'b2.png',
+                        'b3.png', 'b4.png', 'b5.png', 'b6.png', 'b7.png', 'd0.png', 'd1.png',
+                        'd2.png', 'd3.png', 'd4.png', 'f0.png', 'f1.png', 'f2.png', 'h0.png',
+                        'h1.png', 'h2.png', 'h3.png', 's0.png'])]),
+                ( 'clouds',
+                  [ 'noise.dds', ('ceiling', ['c2.dds', 'c2_eco.dds']),
+                    ( 'far',
+                      [ 'far01.dds', 'far02.dds', 'far03.dds', 'far04.dds', 'far05.dds', 'far06.dds',
+                        'far07.dds', 'far08.dds', 'far09.dds', 'far10.dds', 'far11.dds', 'far12.dds',
+                        'far13.dds', 'far14.dds', 'far15.dds']),
+                    ('hazy', ['hazy1.dds']), ('horizon', ['h1.dds', 'h21.dds', 'h31.dds']),
+                    ( 'info',
+                      [ '..dds', '0.dds', '1.dds', '2.dds', '3.dds', '4.dds', '5.dds', '6.dds',
+                        '7.dds', '8.dds', '9.dds', 'csp_update_to.dds', 'is_needed.dds']),
+                    ( 'near',
+                      [ 'n1.dds', 'n2.dds', 'n3.dds', 'n4.dds', 'n7.dds', 'n71.dds', 'n72.dds',
+                        'n73.dds', 'n81.dds']),
+                    ( 'single',
+                      ['011.dds', '021.dds', '031.dds', '041.dds', '051.dds', '061.dds', '071.dds']),
+                    ( 'strato',
+                      [ 's1.dds', 's1_eco.dds', 's2.dds', 's2_eco.dds', 's3.dds', 's3_eco.dds',
+                        's5.dds', 's5_eco.dds'])]),
+                ('space', ['moon.dds', 'starmap_4k.dds', 'starmap_8k.dds'])])]),
+        ( 'weather-controllers',
+          [ ( 'sol',
+              [ 'controller.lua', 'ctrl_config.lua', 'manifest.ini', 'sol__interface.lua',
+                'sol__sequenzer.lua', 'sol__weather_changer.lua', 'sol__weather_plan.lua',
+                'tools.lua', 'weather_params.lua',
+                ( 'weather_plans',
+                  [ '__test.lua', 'clear_to_rain.lua', 'd_dynamic_complex.lua',
+                    'd_dynamic_complex_faster.lua', 'd_random_10mins.lua', 'd_random_1hour.lua',
+                    'd_random_30mins.lua', 'd_random_complex.lua', 'd_random_complex_faster.lua',
+                    'damgams_randomized.lua', 'demo.lua', 'extemetest.lua', 'laguna.lua',
+                    'lemans.lua', 'raintest.lua', 'random.lua', 'sequenceofall.lua',
+                    'sol_random_1hour.lua', 'storm.lua', 'transition_test.lua', 'unpredictable.lua',
+                    'watertest.lua'])]),
+            ( 'sol2',
+              [ 'cm-drive.lua', 'controller.lua', 'manifest.ini', 'reset_dummy.lua', 'settings.ini',
+                'sol__interface.lua', 'sol__shared_memory__backup.lua', 'tools.lua', 'utils_lut.lua',
+                'weather_params.lua']),
+            ('sol2static', ['controller.lua', 'manifest.ini'])])]),
+    ( 'system',
+      [ ( 'cfg',
+          [ ( 'ppfilters',
+              [ '__sol.ini', '__sol_color_neutral_linear.ini',
+                '__sol_color_neutral_sensitometric.ini', '__sol_extra.ini',
+                '__sol_extra_reinhard.ini', '__sol_fakehdr.ini', '__sol_hdr.ini',
+                'custom config example.ini',
+                ( 'sol_custom_configs',
+                  [ '__sol.lua', '__sol_basic_cc.lua', '__sol_color_neutral_linear.lua',
+                    '__sol_color_neutral_sensitometric.lua', '__sol_extra.lua',
+                    '__sol_extra_reinhard.lua', '__sol_fakehdr.lua', '__sol_hdr.lua',
+                    'custom config example v2.lua', 'custom config example.lua',
+                    'default.lua'])])])])
+  ],
+}
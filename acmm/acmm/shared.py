@@ -14,6 +14,11 @@ class AppLang(Enum):
 class InstallMethod(Enum):
   UPDATE = 0
   CLEAN = 1
+  LINK = 2
+
+class FileChange(Enum):
+  ADDED = 0
+  MODIFIED = 1
 
 # Exceptions
 class InvalidAsset(Exception):
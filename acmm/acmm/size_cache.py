@@ -0,0 +1,138 @@
+# Imports
+from pathlib import Path
+import sqlite3, threading, os
+
+# Internal imports
+from . import utils
+
+# Shorthand vars
+schema = '''
+CREATE TABLE IF NOT EXISTS dirs (
+  path TEXT PRIMARY KEY,
+  parent TEXT NOT NULL,
+  ino INTEGER NOT NULL,
+  mtime_ns INTEGER NOT NULL,
+  files_size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent);
+'''
+
+# The cache used by the size getters, enabled by the Manager.
+cache = None
+
+# A persistent cache of directory sizes, similar to an incremental `du`.
+#
+# For every directory it stores the total size of the files directly inside
+# it, along with the directory's inode and mtime. A directory is only scanned
+# again if its inode or mtime changed, otherwise only its subdirectories are
+# checked. Note that changing a file in place does not change the mtime of its
+# directory, so paths which were written to should be forgotten explicitly.
+class SizeCache:
+  def __init__(self, file):
+    file = Path(file)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    self.file = file
+    self.lock = threading.Lock()
+    self.connection = sqlite3.connect(file, check_same_thread=False)
+    with self.lock, self.connection:
+      self.connection.executescript(schema)
+
+  # Returns the query arguments matching a given path and all of its
+  # descendants.
+  def get_tree_range(self, path: str) -> tuple:
+    return path, path + os.sep, path + chr(ord(os.sep) + 1)
+
+  # Removes the records of a given path and all of its descendants. The
+  # records of its ancestors are removed as well, since their subdirectories
+  # are listed from the records while they are unchanged, which would leave
+  # the forgotten path out of their sizes.
+  def forget(self, path):
+    ancestors = [(str(parent),) for parent in Path(path).parents]
+    with self.lock, self.connection:
+      self.connection.execute(
+        'DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)',
+        self.get_tree_range(str(path)),
+      )
+      self.connection.executemany(
+        'DELETE FROM dirs WHERE path = ?', ancestors,
+      )
+
+  # Returns the stored (ino, mtime, files_size) of a given directory and the
+  # paths of its stored subdirectories.
+  def get_record(self, path: str) -> tuple:
+    with self.lock:
+      row = self.connection.execute(
+        'SELECT ino, mtime_ns, files_size FROM dirs WHERE path = ?', (path,),
+      ).fetchone()
+      subdirs = self.connection.execute(
+        'SELECT path FROM dirs WHERE parent = ?', (path,),
+      ).fetchall()
+    return row, [subdir for subdir, in subdirs]
+
+  # Returns the size of the contents of a given directory. Updated records
+  # are appended to `changed` and subdirectories which no longer exist to
+  # `removed`.
+  def get_contents_size(
+    self, path: str, stat: os.stat_result, changed: list, removed: list,
+  ) -> int:
+    row, subdirs = self.get_record(path)
+    if row and row[:2] == (stat.st_ino, stat.st_mtime_ns):
+      files_size = row[2]
+    else:
+      stored_subdirs = subdirs
+      files_size = 0
+      subdirs = []
+      with os.scandir(path) as entries:
+        for entry in entries:
+          if entry.is_dir():
+            subdirs.append(entry.path)
+          else:
+            files_size += entry.stat().st_size
+      parent = os.path.dirname(path)
+      changed.append((path, parent, stat.st_ino, stat.st_mtime_ns, files_size))
+      removed += set(stored_subdirs) - set(subdirs)
+    size = files_size
+    for subdir in subdirs:
+      try:
+        subdir_stat = os.stat(subdir)
+      except FileNotFoundError:
+        continue
+      size += subdir_stat.st_size
+      size += self.get_contents_size(subdir, subdir_stat, changed, removed)
+    return size
+
+  # Returns the size of a given directory, same as utils.get_dir_size.
+  def get_dir_size(self, path: Path) -> int:
+    path = str(path)
+    stat = os.stat(path)
+    changed = []
+    removed = []
+    size = stat.st_size + self.get_contents_size(path, stat, changed, removed)
+    if not changed:
+      return size
+    with self.lock, self.connection:
+      self.connection.executemany(
+        'DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)',
+        [self.get_tree_range(removed_path) for removed_path in removed],
+      )
+      self.connection.executemany(
+        'INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?)', changed,
+      )
+    return size
+
+# Opens a size cache at given file and uses it for all size getters.
+def enable(file):
+  global cache
+  cache = SizeCache(file)
+
+# Returns the size of a given directory, using the cache if it is enabled.
+# Paths inside archives are never cached.
+def get_dir_size(path: Path) -> int:
+  if cache is None or not isinstance(path, str | os.PathLike):
+    return utils.get_dir_size(path)
+  return cache.get_dir_size(path)
+
+# Makes the cache forget a given path, if the cache is enabled.
+def forget(path: Path):
+  if cache is not None:
+    cache.forget(path)
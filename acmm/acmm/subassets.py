@@ -2,14 +2,20 @@
 from pathlib import Path
 
 # Internal imports
-from . import utils, validate_functions, generic_functions, factory
+from . import (
+  utils,
+  size_cache,
+  validate_functions,
+  generic_functions,
+  factory,
+)
 
 # Size getters
 def get_track_layout_size(self) -> int:
-  size = utils.get_dir_size(self.path)
+  size = size_cache.get_dir_size(self.path)
   ui_dir = self.get_ui_dir()
   if ui_dir.is_dir():
-    size += utils.get_dir_size(ui_dir)
+    size += size_cache.get_dir_size(ui_dir)
   return size
 
 # UI info getters
@@ -54,7 +60,7 @@ def get_track_layout_outline_file(self) -> Path:
 def delete_track_layout(self):
   ui_dir = self.get_ui_dir()
   if ui_dir.is_dir():
-    utils.unlink_dir(self.ui_dir)
+    utils.unlink_dir(ui_dir)
   utils.unlink_dir(self.path)
 
 # Mapping functions
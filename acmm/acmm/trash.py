@@ -0,0 +1,160 @@
+# Imports
+from pathlib import Path
+from libjam import notebook
+import os, time
+
+# Internal imports
+from . import utils
+
+# Vars
+info_basename = 'info.json'
+
+# A trash of removed files and directories. Every trashed path is renamed
+# into an entry dir named after a numeric id, next to an info file which
+# records where it came from, so that trashing and restoring are a single
+# rename regardless of how big the path is. The directory has to be on the
+# same filesystem as the trashed paths.
+class Trash:
+  def __init__(self, directory):
+    self.directory = Path(directory)
+
+  # Returns the info of a given entry dir, or None if it is incomplete.
+  def read_info(self, entry_dir: Path) -> dict or None:
+    info_file = entry_dir / info_basename
+    if not info_file.is_file():
+      return None
+    info = notebook.read_json(str(info_file))
+    if not os.path.lexists(entry_dir / info.get('basename')):
+      return None
+    return info
+
+  def write_info(self, entry_dir: Path, info: dict):
+    notebook.write_json(str(entry_dir / info_basename), info, overwrite=True)
+
+  # Moves a given path into the trash and returns the info of its entry, which
+  # holds the given info along with the id, original path and trashing time.
+  def add(self, path: Path, info: dict = None) -> dict:
+    path = Path(path).absolute()
+    self.directory.mkdir(parents=True, exist_ok=True)
+    # Claiming an id, mkdir fails if it was claimed at the same time
+    ids = [
+      int(entry.name) for entry in os.scandir(self.directory)
+      if entry.name.isdigit()
+    ]
+    trash_id = max(ids, default=0) + 1
+    while True:
+      entry_dir = self.directory / str(trash_id)
+      try:
+        entry_dir.mkdir()
+        break
+      except FileExistsError:
+        trash_id += 1
+    info = dict(info or {})
+    info.update({
+      'id': trash_id,
+      'path': str(path),
+      'basename': path.name,
+      'trashed': time.time(),
+      'size': None,
+    })
+    self.write_info(entry_dir, info)
+    try:
+      os.rename(path, entry_dir / path.name)
+    except OSError:
+      (entry_dir / info_basename).unlink()
+      entry_dir.rmdir()
+      raise
+    return info
+
+  # Returns the info of every entry, oldest first.
+  def get_entries(self) -> list[dict]:
+    if not self.directory.is_dir():
+      return []
+    infos = []
+    for entry in os.scandir(self.directory):
+      if not entry.name.isdigit():
+        continue
+      info = self.read_info(Path(entry.path))
+      if info is not None:
+        infos.append(info)
+    infos.sort(key=lambda info: info.get('id'))
+    return infos
+
+  # Returns the trashed path of a given entry.
+  def get_path(self, info: dict) -> Path:
+    return self.directory / str(info.get('id')) / info.get('basename')
+
+  # Returns the size of a given entry, which is stored in its info once it
+  # has been computed.
+  def get_size(self, info: dict) -> int:
+    if info.get('size') is not None:
+      return info.get('size')
+    path = self.get_path(info)
+    if path.is_dir() and not path.is_symlink():
+      size = utils.get_dir_size(path)
+    else:
+      size = os.lstat(path).st_size
+    info['size'] = size
+    self.write_info(path.parent, info)
+    return size
+
+  # Moves the path of a given entry back to where it came from and returns
+  # the info of the entry.
+  def restore(self, trash_id: int) -> dict:
+    entry_dir = self.directory / str(trash_id)
+    info = self.read_info(entry_dir)
+    if info is None:
+      raise FileNotFoundError(f"No entry '{trash_id}' in the trash")
+    path = Path(info.get('path'))
+    if os.path.lexists(path):
+      raise FileExistsError(f"Can not restore entry '{trash_id}', '{path}' exists")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    os.rename(self.get_path(info), path)
+    (entry_dir / info_basename).unlink()
+    entry_dir.rmdir()
+    return info
+
+  # Moves entries out of the trash into a given dir, oldest first, until
+  # none are older than `max_age` seconds and they take up at most `max_size`
+  # bytes. Entries whose ids are in `keep` are never moved and do not count
+  # towards max_size. Sizes are only computed for a max_size above 0, since
+  # a max_size of 0 moves all entries anyway. Incomplete entries are always
+  # moved. Returns the info of every moved entry. The moved entries are left
+  # for the caller to delete, so that an interrupted deletion does not leave
+  # broken entries behind.
+  def purge(
+    self,
+    destination: Path,
+    max_size: int = None,
+    max_age: float = None,
+    keep: list[int] = None,
+  ) -> list[dict]:
+    if not self.directory.is_dir():
+      return []
+    destination = Path(destination)
+    keep = [str(trash_id) for trash_id in keep or []]
+    infos = self.get_entries()
+    ids = [str(info.get('id')) for info in infos]
+    for entry in os.scandir(self.directory):
+      if entry.name not in ids and entry.name not in keep:
+        os.rename(entry.path, destination / entry.name)
+    infos = [info for info in infos if str(info.get('id')) not in keep]
+    if max_size:
+      total_size = sum([self.get_size(info) for info in infos])
+    purged = []
+    for info in infos:
+      is_old = max_age is not None and time.time() - info.get('trashed') > max_age
+      if max_size is None:
+        is_over = False
+      elif max_size == 0:
+        is_over = True
+      else:
+        is_over = total_size > max_size
+      if not is_old and not is_over:
+        break
+      entry_name = str(info.get('id'))
+      os.rename(self.directory / entry_name, destination / entry_name)
+      if max_size:
+        total_size -= info.get('size')
+      purged.append(info)
+    return purged
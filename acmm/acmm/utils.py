@@ -1,28 +1,69 @@
 # Imports
 from pathlib import Path
 from libjam import notebook
-import html, re
+import html, re, os, hashlib
 
 # Shorthand vars
 re_html_br_tag = re.compile('<.*?br.*?>')
 
-# Gets all paths from given directory, recursively.
-def get_paths_recursive(directory: Path) -> list[Path]:
-  paths = []
-  for path in directory.iterdir():
-    paths.append(path)
-    if path.is_dir():
-      paths += get_paths_recursive(path)
-  return paths
+# Yields a DirEntry for every path in given directory, recursively.
+# Directories are yielded before their contents if topdown is True, and
+# after them otherwise. Only one scandir iterator per depth level is kept
+# open, so memory use does not grow with the number of paths.
+#
+# If descend is given, it is called with every directory entry after the
+# entry has been yielded, and the directory is skipped if it returns False.
+# Directories inside archives are walked as well, in which case the entries
+# are VirtualPaths.
+def walk(
+  directory: Path,
+  topdown: bool = True,
+  follow_symlinks: bool = True,
+  descend: callable = None,
+) -> iter[os.DirEntry]:
+  # importing on-demand for faster overall import times
+  from .archive_functions import scandir
+  stack = [(None, scandir(directory))]
+  try:
+    while stack:
+      parent, iterator = stack[-1]
+      entry = next(iterator, None)
+      if entry is None:
+        iterator.close()
+        stack.pop()
+        if parent is not None and not topdown:
+          yield parent
+        continue
+      is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+      if topdown or not is_dir:
+        yield entry
+      if is_dir:
+        if descend and not descend(entry):
+          continue
+        stack.append((entry, scandir(entry)))
+  finally:
+    for _, iterator in stack:
+      iterator.close()
 
-# Deletes the given directory
+# Deletes the given directory. If it is a symlink, only the link is deleted.
 def unlink_dir(directory: Path):
-  for path in directory.iterdir():
-    if path.is_dir():
-      unlink_dir(path)
+  if os.path.islink(directory):
+    os.unlink(directory)
+    return
+  for entry in walk(directory, topdown=False, follow_symlinks=False):
+    if entry.is_dir(follow_symlinks=False):
+      os.rmdir(entry)
     else:
-      path.unlink()
-  directory.rmdir()
+      os.unlink(entry)
+  os.rmdir(directory)
+
+# Returns the sha256 hex digest of a given file, reading it in chunks.
+def get_file_hash(file: Path) -> str:
+  file_hash = hashlib.sha256()
+  with open(file, 'rb') as f:
+    while chunk := f.read(1024 * 1024):
+      file_hash.update(chunk)
+  return file_hash.hexdigest()
 
 # Returns the size of a given file.
 def get_file_size(path: Path) -> int:
@@ -31,9 +72,8 @@ def get_file_size(path: Path) -> int:
 # Returns the size of a given directory.
 def get_dir_size(path: Path) -> int:
   size = get_file_size(path)
-  subpaths = get_paths_recursive(path)
-  for subpath in subpaths:
-    size += get_file_size(subpath)
+  for entry in walk(path):
+    size += entry.stat().st_size
   return size
 
 # Unescapes html sequences and like line break tags in a given dict.
@@ -1,16 +1,17 @@
 # Imports
 from pathlib import Path
-import os
 
 # Internal imports
 from . import data
+from .archive_functions import scandir
 
-# Returns True if all given items exist in root, case insensitive.
+# Returns True if all given items exist in root, case insensitive. Root may
+# also be a VirtualPath inside an archive.
 def validate(root: Path, items: list[str or tuple[str, list]]) -> bool:
   assert type(items) is list
   if not root.is_dir():
     return False
-  entries = {entry.name.lower(): entry for entry in os.scandir(root)}
+  entries = {entry.name.lower(): entry for entry in scandir(root)}
   for item in items:
     if type(item) is str:
       entry = entries.get(item.lower())
@@ -79,10 +80,10 @@ def is_track(path: Path) -> bool:
 
 # Returns True if given path is a path to a ppfilter.
 def is_ppfilter(path: Path) -> bool:
-  if not path.is_file():
-    return False
   if not path.name.endswith('.ini'):
     return False
+  if not path.is_file():
+    return False
   text = path.read_text(errors='ignore')
   required_texts = ['[ABOUT]', 'YEBIS']
   for required_text in required_texts:
@@ -128,3 +129,8 @@ def is_pure(path: Path) -> bool:
 def is_sol(path: Path) -> bool:
   common_files = data.get('sol-common-files')
   return validate(path, common_files)
+
+# Validators which expect a path to a file rather than a directory.
+file_validators = [
+  is_ppfilter,
+]
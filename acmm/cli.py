@@ -3,12 +3,11 @@
 # Imports
 from libjam import Captain, drawer, typewriter, flashcard
 from pathlib import Path
-import sys, time, math
+import sys, time, threading, contextlib
 
 # Internal imports
 from . import acmm
-from .shared import manager, get_temp_dir
-from . import extension_cli
+from .shared import get_manager
 
 # Helper vars
 asset_titles = {
@@ -33,7 +32,7 @@ def get_installed_assets() -> list[acmm.Asset]:
     if not enabled:
       continue
     # Fetching
-    assets = manager.fetch_assets(asset_class)
+    assets = get_manager().fetch_assets(asset_class)
     filtered_assets = []
     for asset in assets:
       if opts.get('all'):
@@ -76,6 +75,8 @@ def categorise_assets(assets: list[acmm.Asset]) -> list[acmm.Asset]:
   return list(categories.values())
 
 def print_assets(assets: list[acmm.Asset]):
+  if opts.get('size'):
+    sizes = dict(get_manager().get_sizes(assets, opts.get('jobs')))
   categories = categorise_assets(assets)
   sections = []
   for assets in categories:
@@ -88,7 +89,7 @@ def print_assets(assets: list[acmm.Asset]):
     # Making a category heading
     heading = typewriter.bolden(title + ': ')
     if opts.get('size'):
-      size = sum([asset.get_size() for asset in assets])
+      size = sum([sizes.get(asset) for asset in assets])
       size, units, _ = drawer.get_readable_filesize(size)
       size = round(size, 1)
       units = units.upper()
@@ -108,15 +109,60 @@ def print_assets(assets: list[acmm.Asset]):
   # Printing
   print('\n'.join(sections))
 
-def get_delay(num: int, delay_min: float, delay_max: float) -> float:
-  # Getting normalised inverse log
+def print_trash(infos: list[dict]):
+  lines = []
+  for info in infos:
+    asset_id = info.get('asset-id')
+    if ' ' in asset_id:
+      asset_id = f'"{asset_id}"'
+    trashed = time.strftime('%Y-%m-%d %H:%M', time.localtime(info.get('trashed')))
+    lines.append(f"{info.get('id')}) {asset_id} ({trashed})")
+  print(typewriter.list_to_columns(lines, 0, 2, 2))
+
+# Deletes mods from the trash with the given limits. The mods are moved out
+# of the trash before anything is deleted, so an interrupted deletion is
+# finished the next time the trash is purged.
+def purge_trash(**limits) -> int:
+  def print_delete_progress(done: int, todo: int):
+    typewriter.print_progress('Deleting', done, todo)
   try:
-    delay = 1 / (math.log2(1 + num) * 0.5) * 0.5
-  except (ValueError, ZeroDivisionError):
-    delay = 1
-  # Remapping
-  delay = (delay * (delay_max - delay_min)) + delay_min
-  return delay
+    purged = get_manager().purge_trash(
+      **limits, jobs=opts.get('jobs'), progress_function=print_delete_progress,
+    )
+  except KeyboardInterrupt:
+    typewriter.clear_lines(0)
+    typewriter.print('Deletion aborted.')
+    return 130
+  if purged:
+    typewriter.clear_lines(0)
+    typewriter.print(f"Deleted {len(purged)} mods from the trash.")
+  return 0
+
+# Takes the value of the jobs option out of given args, since Captain only
+# supports flags. Like the other global options, it is only taken from the
+# args before the command, so that the args of the command are left alone.
+# Returns the remaining args and the number of jobs.
+def pop_jobs_option(args: list) -> tuple[list, int or None]:
+  jobs = None
+  remaining_args = []
+  args = iter(args)
+  for arg in args:
+    if not arg.startswith('-'):
+      # Reached the command
+      remaining_args.append(arg)
+      remaining_args += list(args)
+      break
+    if arg in ['-j', '--jobs']:
+      value = next(args, '')
+    elif arg.startswith('--jobs='):
+      value = arg.removeprefix('--jobs=')
+    else:
+      remaining_args.append(arg)
+      continue
+    if not value.isdigit() or int(value) < 1:
+      captain.on_usage_error(f"invalid number of jobs '{value}'")
+    jobs = int(value)
+  return remaining_args, jobs
 
 class CLI:
   'A CLI mod manager for Assetto Corsa'
@@ -141,48 +187,60 @@ class CLI:
         print(f"{path}: unsupported filetype.")
         return 1
       paths[i] = path
-    # Unpacking
-    with get_temp_dir() as temp_dir:
-      try:
-        unpacked = []
-        for path in paths:
-          if path.is_file():
-            out_dir = Path(temp_dir) / path.name
-            def print_extract_progress(done: int, todo: int):
-              typewriter.print_progress(f"Extracting '{path.name}'", done, todo)
-            drawer.extract_archive(str(path), str(out_dir), print_extract_progress)
-            typewriter.clear_lines(0)
-            unpacked.append(out_dir)
-          else:
-            unpacked.append(path)
-      except KeyboardInterrupt:
-        typewriter.clear_lines(0)
-        print('Archive extraction aborted.')
-        return 130
-      # Searching for mods
-      assets = manager.find_assets(unpacked)
-      # Checking found mods
-      if not assets:
-        print('No mods found.')
+    # Searching for mods, archives are searched without extracting them
+    try:
+      assets = get_manager().find_assets(paths)
+    except ValueError as error:
+      print(f'Error: {error}')
+      return 1
+    # Checking found mods
+    if not assets:
+      print('No mods found.')
+      return 0
+    # Getting user confirmation
+    print_assets(assets)
+    try:
+      if not flashcard.yn_prompt("Install listed mods?"):
+        print("Installation cancelled.")
         return 0
-      # Getting user confirmation
-      print_assets(assets)
-      try:
-        if not flashcard.yn_prompt("Install listed mods?"):
-          print("Installation cancelled.")
-          return 0
-      except KeyboardInterrupt:
-        print()
-        return 130
-      # Installing
-      installed = []
-      n_assets = len(assets)
-      for asset in assets:
-        asset_id = asset.get_id()
+    except KeyboardInterrupt:
+      print()
+      return 130
+    # Unpacking only the found mods, several archives at once. The mods of
+    # every archive are installed as soon as it is unpacked. On an interrupt,
+    # the archives which are being unpacked are stopped at their next chunk.
+    installed = []
+    n_assets = len(assets)
+    print_lock = threading.Lock()
+    def print_extract_progress(done: int, todo: int):
+      if todo:
+        with print_lock:
+          typewriter.print_progress('Extracting', done, todo)
+    with get_manager().get_staging_dir() as temp_dir:
+      extracted = get_manager().extract_assets_as_completed(
+        assets, temp_dir, print_extract_progress, opts.get('jobs'),
+      )
+      with contextlib.closing(extracted):
         try:
-          typewriter.print_progress(f"Installing '{asset_id}'", len(installed), n_assets)
-          asset = manager.install(asset, acmm.InstallMethod.UPDATE)
-          installed.append(asset)
+          for extracted_assets in extracted:
+            for asset in extracted_assets:
+              asset_id = asset.get_id()
+              with print_lock:
+                typewriter.print_progress(
+                  f"Installing '{asset_id}'", len(installed), n_assets,
+                )
+              try:
+                asset = get_manager().install(
+                  asset, acmm.InstallMethod.UPDATE, jobs=opts.get('jobs'),
+                )
+              except NotImplementedError:
+                typewriter.clear_lines(0)
+                print(f"Error: Mod '{asset_id}' is not installable. Aborting installation.")
+                if len(installed) > 0:
+                  print('Already installed these mods:')
+                  print_assets(installed)
+                return 1
+              installed.append(asset)
         except KeyboardInterrupt:
           typewriter.clear_lines(0)
           typewriter.print('Installation aborted.')
@@ -192,13 +250,6 @@ class CLI:
             print('Already installed these mods:')
             print_assets(installed)
           return 130
-        except NotImplementedError:
-          typewriter.clear_lines(0)
-          print(f"Error: Mod '{asset_id}' is not installable. Aborting installation.")
-          if len(installed) > 0:
-            print('Already installed these mods:')
-            print_assets(installed)
-          return 1
       typewriter.clear_lines(0)
       print(f'Installed {len(installed)} mods.')
 
@@ -220,30 +271,61 @@ class CLI:
     except KeyboardInterrupt:
       print()
       return 130
-    # Deleting
-    delay = get_delay(num=n_assets, delay_min=0, delay_max=0.2)
-    deleted = []
-    for asset in assets:
-      asset_id = asset.get_id()
+    # Moving the mods to the trash, which is instant regardless of their size
+    infos = get_manager().trash(assets)
+    typewriter.print(f"Moved {n_assets} mods to the trash:")
+    print_trash(infos)
+    print("Restore them with 'acmm restore <ID>'.")
+    # Deleting mods which have been in the trash for too long. The size limit
+    # is not applied, since it would walk every trashed mod.
+    return purge_trash(max_size=None, keep=[info.get('id') for info in infos])
+
+  def restore(self, trash_id: str, *additional_ids):
+    'Restore mod(s) from the trash'
+    trash_ids = [trash_id] + list(additional_ids)
+    restored = []
+    for trash_id in trash_ids:
       try:
-        typewriter.print_status(f"Deleting '{asset_id}'...")
-        time.sleep(delay)
-        asset.delete()
-      except KeyboardInterrupt:
-        typewriter.print('Deletion aborted.')
-        if len(deleted) == 0:
-          typewriter.print('No mods were deleted.')
-        else:
-          typewriter.print('Already deleted these mods:')
-          print(typewriter.list_to_columns(deleted))
-        return 130
-      deleted.append(asset_id)
-    # Returning
-    typewriter.print(f"Deleted {len(deleted)} mods.")
+        asset = get_manager().restore(trash_id)
+      except (FileNotFoundError, FileExistsError, acmm.InvalidAsset) as error:
+        print(f'Error: {error}')
+        if len(restored) > 0:
+          print('Already restored these mods:')
+          print_assets(restored)
+        return 1
+      restored.append(asset)
+    print_assets(restored)
+    print(f'Restored {len(restored)} mods.')
     return 0
 
+  def trash(self):
+    'List mods in the trash'
+    infos = get_manager().get_trash()
+    if not infos:
+      print('The trash is empty.')
+      return 0
+    print_trash(infos)
+    return 0
+
+  def empty_trash(self):
+    'Delete all mods in the trash'
+    infos = get_manager().get_trash()
+    if not infos:
+      print('The trash is empty.')
+      return 0
+    print_trash(infos)
+    try:
+      if not flashcard.yn_prompt(f'Delete the listed {len(infos)} mods?'):
+        return 0
+    except KeyboardInterrupt:
+      print()
+      return 130
+    return purge_trash(max_size=0)
+
   def extension(self, *args):
     'Manage your extensions'
+    # importing on-demand for faster overall import times
+    from . import extension_cli
     return extension_cli.run_as_subcli(args, 'acmm-extension')
 
 
@@ -265,10 +347,11 @@ captain.add_option('all',   ['all', 'A'],   'Show all assets')
 captain.add_option('kunos', ['kunos', 'k'], 'Show Kunos assets')
 captain.add_option('dlc',   ['dlc', 'd'],   'Show DLC assets')
 captain.add_option('size',  ['size', 's'],  "Show mods' disk usage")
+captain.add_option('jobs',  ['jobs', 'j'],  'Threads to use, before the command (-j N)')
 
 def main() -> int:
   # Checking whether to use the extension subcli
-  all_args = sys.argv[1:]
+  all_args, jobs = pop_jobs_option(sys.argv[1:])
   for i, arg in enumerate(all_args):
     if arg.startswith('-'):
       continue
@@ -277,6 +360,7 @@ def main() -> int:
   # Parsing user input
   global opts
   function, args, opts = captain.parse(all_args)
+  opts['jobs'] = jobs
   # Enabling all filters if none are active
   enabled_categories = 0
   for category in fetchable_categories:
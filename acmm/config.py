@@ -1,7 +1,7 @@
 # Imports
 from libjam import notebook
 from pathlib import Path
-import vdf
+from platformdirs import user_cache_dir
 
 # Backend
 import acmm
@@ -37,6 +37,9 @@ template = '''\
 ledger = notebook.Ledger('acmm')
 config_obj = ledger.init_config('config', default_values, template)
 config_dict = config_obj.read()
+# Caches are kept in the user's cache directory, since downloaded archives
+# can take up gigabytes
+cache_dir = Path(user_cache_dir('acmm'))
 
 # Getting steam dir
 appid = '244210'
@@ -49,48 +52,91 @@ if steam_dir is None:
 steam_dir = Path(steam_dir)
 if not steam_dir.is_dir():
   config_obj.on_error("Specified 'steam-directory' does not exist")
-# Getting ac dir
-libraryfolders_file = steam_dir / 'config' / 'libraryfolders.vdf'
-if not libraryfolders_file.is_file():
-  config_obj.on_error(
-    f"Invalid Steam installation at '{steam_dir}'. "
-    f"The file '{libraryfolders_file}' does not exist."
-  )
-libraryfolders = libraryfolders_file.read_text()
-libraryfolders = vdf.loads(libraryfolders)
-libraryfolders = list(libraryfolders.get('libraryfolders').values())
-library_folder = None
-# Finding the right steamapps dir
-for item in libraryfolders:
-  apps = item.get('apps')
-  if appid in apps:
-    library_folder = item.get('path')
-    break
-if library_folder is None:
-  config_obj.on_error('Could not find Assetto Corsa')
+# Returns the mtime of a given file, or None if it does not exist.
+def get_mtime(path: Path) -> int or None:
+  try:
+    return path.stat().st_mtime_ns
+  except OSError:
+    return None
 
-# Getting assetto dir
-library_dir = Path(library_folder)
-steamapps_dir = library_dir / 'steamapps'
-compatdata_dir = steamapps_dir / 'compatdata'
-appmanifest_file = steamapps_dir / f'appmanifest_{appid}.acf'
+# Finds the Assetto Corsa directory using Steam's library files. Returns the
+# directory and the app manifest it was read from.
+def find_assetto_dir() -> tuple[Path, Path]:
+  # importing on-demand for faster overall import times
+  import vdf
+  # Getting ac dir
+  if not libraryfolders_file.is_file():
+    config_obj.on_error(
+      f"Invalid Steam installation at '{steam_dir}'. "
+      f"The file '{libraryfolders_file}' does not exist."
+    )
+  libraryfolders = libraryfolders_file.read_text()
+  libraryfolders = vdf.loads(libraryfolders)
+  libraryfolders = list(libraryfolders.get('libraryfolders').values())
+  library_folder = None
+  # Finding the right steamapps dir
+  for item in libraryfolders:
+    apps = item.get('apps')
+    if appid in apps:
+      library_folder = item.get('path')
+      break
+  if library_folder is None:
+    config_obj.on_error('Could not find Assetto Corsa')
+  # Getting assetto dir
+  library_dir = Path(library_folder)
+  steamapps_dir = library_dir / 'steamapps'
+  appmanifest_file = steamapps_dir / f'appmanifest_{appid}.acf'
+  if not appmanifest_file.is_file():
+    config_obj.on_error(
+      f"Invalid Steam installation at '{steam_dir}'. "
+      f"The file '{appmanifest_file}' does not exist."
+    )
+  appmanifest = appmanifest_file.read_text()
+  appmanifest = vdf.loads(appmanifest)
+  install_dir = appmanifest.get('AppState').get('installdir')
+  assetto_dir = steamapps_dir / 'common' / install_dir
+  try:
+    acmm.Manager.check_assetto_dir(assetto_dir)
+  except FileNotFoundError:
+    config_obj.on_error('Assetto Corsa directory does not exist')
+  except NotADirectoryError:
+    config_obj.on_error('What the hell did you do to your Assetto Corsa installation?')
+  except acmm.InvalidAssettoDir:
+    config_obj.on_error('Invalid Assetto Corsa directory')
+  return assetto_dir, appmanifest_file
 
-if not appmanifest_file.is_file():
-  config_obj.on_error(
-    f"Invalid Steam installation at '{steam_dir}'. "
-    f"The file '{appmanifest_file}' does not exist."
-  )
+# Initialising the cache of the found Assetto Corsa directory, which stays
+# valid as long as Steam's library files are unchanged
+cache_template = '''\
+# This file is generated by the acmm CLI, there is no need to edit it
+'''
+cache_obj = ledger.init_config('cache', {}, cache_template)
+cache_dict = cache_obj.read()
 
-appmanifest = appmanifest_file.read_text()
-appmanifest = vdf.loads(appmanifest)
-install_dir = appmanifest.get('AppState').get('installdir')
-assetto_dir = steamapps_dir / 'common' / install_dir
+# Searches for the Assetto Corsa directory and caches it along with the
+# mtimes of the files it was found with. Returns the directory.
+def search_assetto_dir() -> Path:
+  assetto_dir, appmanifest_file = find_assetto_dir()
+  cache_obj.write({
+    'steam-directory': str(steam_dir),
+    'assetto-directory': str(assetto_dir),
+    'appmanifest-file': str(appmanifest_file),
+    'libraryfolders-mtime': get_mtime(libraryfolders_file),
+    'appmanifest-mtime': get_mtime(appmanifest_file),
+  })
+  return assetto_dir
 
-try:
-  acmm.Manager.check_assetto_dir(assetto_dir)
-except FileNotFoundError:
-  config_obj.on_error('Assetto Corsa directory does not exist')
-except NotADirectoryError:
-  config_obj.on_error('What the hell did you do to your Assetto Corsa installation?')
-except acmm.InvalidAssettoDir:
-  config_obj.on_error('Invalid Assetto Corsa directory')
+# Getting assetto dir. The cached directory is only checked by the Manager,
+# which searches for it again if the check fails.
+libraryfolders_file = steam_dir / 'config' / 'libraryfolders.vdf'
+cached_appmanifest = cache_dict.get('appmanifest-file')
+is_assetto_dir_cached = (
+  cached_appmanifest is not None and
+  cache_dict.get('steam-directory') == str(steam_dir) and
+  cache_dict.get('libraryfolders-mtime') == get_mtime(libraryfolders_file) and
+  cache_dict.get('appmanifest-mtime') == get_mtime(Path(cached_appmanifest))
+)
+if is_assetto_dir_cached:
+  assetto_dir = Path(cache_dict.get('assetto-directory'))
+else:
+  assetto_dir = search_assetto_dir()
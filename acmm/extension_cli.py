@@ -1,12 +1,13 @@
 #! /usr/bin/env python3
 
 # Imports
-from libjam import Captain, drawer, typewriter, cloud
+from libjam import Captain, drawer, typewriter
 import sys
 
 # Internal imports
 from . import acmm
-from .shared import manager, get_temp_dir
+from .acmm import archive_functions
+from .shared import get_manager
 
 # Helper functions
 def format_info(
@@ -34,7 +35,7 @@ class CLI:
   'Manage your Assetto Corsa extensions'
   def show_csp(self):
     'Print information about CSP'
-    csp = manager.fetch_extension(acmm.Extension.CSP)
+    csp = get_manager().fetch_extension(acmm.Extension.CSP)
     if not csp:
       print('CSP is not installed.')
       return 1
@@ -55,7 +56,7 @@ class CLI:
   def install_csp(self):
     'Download and install CSP'
     typewriter.print_status('Fetching available versions...')
-    versions = manager.fetch_csp_versions()
+    versions = get_manager().fetch_csp_versions()
     keys = list(versions.keys())
     keys.reverse()
     typewriter.clear_lines(0)
@@ -87,22 +88,24 @@ class CLI:
     except KeyboardInterrupt:
       print()
       return 1
-    download_link = versions.get(chosen_key).get('download-link')
-    def print_download_progress(todo, done):
-      typewriter.print_progress('Downloading', todo, done)
-    downloaded_bytes = cloud.download(download_link, print_download_progress)
-    def print_extract_progress(todo, done):
-      typewriter.print_progress('Extracting', todo, done)
-    with get_temp_dir() as temp_dir:
-      drawer.extract_archive(downloaded_bytes, temp_dir, print_extract_progress)
+    def print_download_progress(done, todo):
+      if todo:
+        typewriter.print_progress('Downloading', done, todo)
+    archive_file = get_manager().download_csp(
+      chosen_key, progress_function=print_download_progress,
+    )
+    def print_extract_progress(done, todo):
+      typewriter.print_progress('Extracting', done, todo)
+    with get_manager().get_staging_dir() as temp_dir:
+      archive_functions.extract(archive_file, temp_dir, print_extract_progress)
       typewriter.print_status('Installing...')
       csp = acmm.Extension.CSP(temp_dir)
-      manager.install(csp, acmm.InstallMethod.UPDATE)
+      get_manager().install(csp, acmm.InstallMethod.UPDATE)
     print('Installed.')
 
   def uninstall_csp(self):
     'Delete Custom Shaders Patch'
-    csp = manager.fetch_extension(acmm.Extension.CSP)
+    csp = get_manager().fetch_extension(acmm.Extension.CSP)
     if not csp:
       print('CSP is not installed')
       return 1
@@ -110,7 +113,7 @@ class CLI:
 
   def show_pure(self):
     'Print information about Pure'
-    pure = manager.fetch_extension(acmm.Extension.Pure)
+    pure = get_manager().fetch_extension(acmm.Extension.Pure)
     if not pure:
       print('Pure is not installed.')
       return 1
@@ -137,7 +140,7 @@ class CLI:
 
   def uninstall_pure(self):
     'Delete Pure'
-    pure = manager.fetch_extension(acmm.Extension.Pure)
+    pure = get_manager().fetch_extension(acmm.Extension.Pure)
     if not pure:
       print('Pure is not installed.')
       return 1
@@ -145,7 +148,7 @@ class CLI:
 
   def show_sol(self):
     'Print information about SOL'
-    sol = manager.fetch_extension(acmm.Extension.SOL)
+    sol = get_manager().fetch_extension(acmm.Extension.SOL)
     if not sol:
       print('SOL is not installed.')
       return 1
@@ -164,7 +167,7 @@ class CLI:
 
   def uninstall_sol(self):
     'Delete SOL'
-    sol = manager.fetch_extension(acmm.Extension.SOL)
+    sol = get_manager().fetch_extension(acmm.Extension.SOL)
     if not sol:
       print('SOL is not installed.')
       return 1
@@ -1,15 +1,19 @@
 # Imports
-from libjam import drawer, typewriter
-from pathlib import Path
-import sys, tempfile
+import functools
 
 # Backend
 import acmm
 
-# Configuration
-from .config import assetto_dir
-
-# Variables
-manager = acmm.Manager(assetto_dir)
-def get_temp_dir() -> Path:
-  return tempfile.TemporaryDirectory(prefix='acmm-')
+# Returns the manager, creating it on first use. This defers reading the
+# configuration until a command actually needs it.
+@functools.cache
+def get_manager() -> acmm.Manager:
+  from . import config
+  try:
+    return acmm.Manager(config.assetto_dir, config.cache_dir)
+  except (FileNotFoundError, NotADirectoryError, acmm.InvalidAssettoDir):
+    if not config.is_assetto_dir_cached:
+      raise
+  # The cached directory changed without Steam's files changing, searching
+  # for it again reports any problems through the config
+  return acmm.Manager(config.search_assetto_dir(), config.cache_dir)
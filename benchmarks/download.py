@@ -0,0 +1,84 @@
+#! /usr/bin/env python3
+
+# Compares downloading a file over a single connection with segmented
+# downloads over several connections, using a local server which supports
+# range requests and limits the bandwidth of every connection.
+# Usage: python benchmarks/download.py [SIZE IN MB] [MB/S PER CONNECTION]
+
+# Imports
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import os, re, sys, tempfile, threading, time
+
+# Backend
+from acmm.acmm import download_functions
+
+# Vars
+jobs_to_compare = [2, 4, 8]
+chunk_size = 64 * 1024
+
+# Serves a single file of random bytes at any path, with range support and
+# a bandwidth limit per connection.
+def start_server(data: bytes, bandwidth: float) -> str:
+  class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    def log_message(self, *args):
+      pass
+    def send_headers(self) -> tuple[int, int]:
+      start, end = 0, len(data) - 1
+      match = re.fullmatch(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+      if match:
+        start = int(match[1])
+        if match[2]:
+          end = min(int(match[2]), end)
+        self.send_response(206)
+        self.send_header('Content-Range', f'bytes {start}-{end}/{len(data)}')
+      else:
+        self.send_response(200)
+      self.send_header('Accept-Ranges', 'bytes')
+      self.send_header('Content-Length', str(end - start + 1))
+      self.end_headers()
+      return start, end
+    def do_HEAD(self):
+      self.send_headers()
+    def do_GET(self):
+      start, end = self.send_headers()
+      for offset in range(start, end + 1, chunk_size):
+        self.wfile.write(data[offset:min(offset + chunk_size, end + 1)])
+        time.sleep(chunk_size / bandwidth)
+  server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  return f'http://127.0.0.1:{server.server_address[1]}/archive.zip'
+
+# Returns how long the given download function took and checks the result.
+def time_download(download_function: callable, data: bytes) -> float:
+  with tempfile.TemporaryDirectory(prefix='acmm-') as temp_dir:
+    file = Path(temp_dir) / 'archive.zip'
+    start = time.perf_counter()
+    download_function(file)
+    elapsed = time.perf_counter() - start
+    if file.read_bytes() != data:
+      raise RuntimeError('Downloaded file does not match')
+  return elapsed
+
+def main() -> int:
+  args = sys.argv[1:]
+  size = float(args[0]) if len(args) > 0 else 64
+  bandwidth = float(args[1]) if len(args) > 1 else 16
+  data = os.urandom(int(size * 1024 * 1024))
+  link = start_server(data, bandwidth * 1024 * 1024)
+  print(f'Downloading {size:g} MB at {bandwidth:g} MB/s per connection:')
+  single = time_download(
+    lambda file: download_functions.download(link, file), data,
+  )
+  print(f'  single stream: {single:6.2f} s')
+  for jobs in jobs_to_compare:
+    elapsed = time_download(
+      lambda file: download_functions.download_segmented(link, file, jobs=jobs),
+      data,
+    )
+    print(f'  {jobs} segments:    {elapsed:6.2f} s  ({single / elapsed:.1f}x)')
+  return 0
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,57 @@
+#! /usr/bin/env python3
+
+# Measures how long the acmm CLI takes to start up and print its first output,
+# and lists the imports which take the longest.
+# Usage: python benchmarks/import_time.py [CLI ARGS]...
+# The CLI args default to '--help'. Use 'list -t' to include reading the
+# configuration and fetching assets.
+
+# Imports
+import subprocess, statistics, sys, time
+
+# Vars
+runs = 10
+target = 0.1
+n_slowest_imports = 10
+
+# Returns the time it took for the given command to print its first byte.
+def time_to_first_output(command: list) -> float:
+  start = time.perf_counter()
+  process = subprocess.Popen(
+    command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+  )
+  process.stdout.read(1)
+  elapsed = time.perf_counter() - start
+  process.communicate()
+  return elapsed
+
+# Returns (self time, cumulative time, module) tuples for every module imported
+# by the CLI, slowest first.
+def get_import_times() -> list[tuple]:
+  result = subprocess.run(
+    [sys.executable, '-X', 'importtime', '-c', 'import acmm.cli'],
+    stderr=subprocess.PIPE, text=True, check=True,
+  )
+  import_times = []
+  for line in result.stderr.splitlines()[1:]:
+    self_time, cumulative_time, module = line.removeprefix('import time:').split('|')
+    import_times.append((int(self_time), int(cumulative_time), module.strip()))
+  import_times.sort(reverse=True)
+  return import_times
+
+def main() -> int:
+  args = sys.argv[1:] or ['--help']
+  command = [sys.executable, '-m', 'acmm.cli'] + args
+  times = [time_to_first_output(command) for _ in range(runs)]
+  median = statistics.median(times)
+  print(f"First output of 'acmm {' '.join(args)}' over {runs} runs:")
+  print(f'  median: {median * 1000:.1f} ms (target: < {target * 1000:.0f} ms)')
+  print(f'  min:    {min(times) * 1000:.1f} ms')
+  print(f'  max:    {max(times) * 1000:.1f} ms')
+  print('Slowest imports (self time):')
+  for self_time, cumulative_time, module in get_import_times()[:n_slowest_imports]:
+    print(f'  {self_time / 1000:7.1f} ms  {module}')
+  return 0 if median < target else 1
+
+if __name__ == '__main__':
+  sys.exit(main())